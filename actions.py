@@ -31,6 +31,11 @@ class Action:
         self.enabled = True  # Whether this action is enabled
         self.created_at = time.time()  # When the action was created
     
+    @property
+    def display_delay(self) -> float:
+        """Delay shown in the action list"""
+        return self.delay
+    
     def execute(self) -> bool:
         """Execute the action. Returns True if successful, False otherwise."""
         try:
@@ -250,6 +255,11 @@ class DelayAction(Action):
         self.name = "Delay"
         self.description = f"Wait for {wait_time} seconds"
     
+    @property
+    def display_delay(self) -> float:
+        """Delay shown in the action list"""
+        return self.wait_time
+    
     def _execute_impl(self) -> bool:
         """Execute the delay action"""
         logger.info(f"Waiting for {self.wait_time} seconds")
@@ -91,8 +91,8 @@ class PlaybianAutoTyper:
         # UI state variables
         self.setup_variables()
         
-        # Setup UI
-        self.setup_styles()
+        # Setup UI (styles are applied on the first idle tick so the window shows sooner)
+        self.root.after_idle(ModernStyle.setup_styles)
         self.setup_menu()
         self.setup_ui()
         self.setup_shortcuts()
@@ -144,7 +144,7 @@ class PlaybianAutoTyper:
     
     def setup_styles(self):
         """Setup application styles"""
-        ModernStyle.setup_styles()
+        ModernStyle.setup_styles(force=True)
     
     def setup_menu(self):
         """Setup application menu bar"""
@@ -7,12 +7,31 @@ This script handles dependency checking, setup, and launching the main applicati
 import sys
 import os
 import subprocess
+import re
+import shutil
+import tempfile
+import logging
 import importlib
-from pathlib import Path
+import importlib.util
+import hashlib
+import pkgutil
+from importlib import metadata
+from functools import lru_cache
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Launcher output goes through its own logger so --quiet can silence it
+log = logging.getLogger('playbian')
 
 # Minimum Python version required
 MIN_PYTHON_VERSION = (3, 8)
 
+# Requirement files read by the launcher; the dicts below are only a
+# fallback for checkouts where the files are missing
+CORE_REQUIREMENTS_FILE = 'requirements-core.txt'
+OPTIONAL_REQUIREMENTS_FILE = 'requirements-optional.txt'
+DEPS_STAMP_NAME = 'deps.stamp'
+
 # Required packages for core functionality
 CORE_PACKAGES = {
     'pyautogui': 'pyautogui>=0.9.54',
@@ -26,251 +45,510 @@ OPTIONAL_PACKAGES = {
     'PIL': 'Pillow>=10.0.0',        # For image operations
 }
 
+# Static launcher text, built once at import
+_BANNER = """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                                                              ║
+    ║         🖱️⌨️  Playbian Auto Typer & Clicker v2.1             ║
+    ║                                                              ║
+    ║              Modern Automation for Everyone                  ║
+    ║                                                              ║
+    ╚══════════════════════════════════════════════════════════════╝
+    """
+
+_HELP = """
+Usage: python run.py [options]
+
+Options:
+  --help, -h          Show this help message
+  --check-deps        Only check dependencies, don't install or launch
+  --install-optional  Install optional packages
+  --version           Show version information
+  --setup             Run setup without launching
+  --verbose, -v       Show full pip output while installing
+  --quiet, -q         Only show warnings and errors
+  --yes, -y           Install optional packages without asking
+
+Environment:
+  PLAYBIAN_LOGLEVEL           Launcher log level (default: INFO)
+  PLAYBIAN_INSTALL_OPTIONAL   Set to 1 to install optional packages, 0 to skip
+
+Examples:
+  python run.py                    # Normal launch
+  python run.py --check-deps       # Check dependencies only
+  python run.py --install-optional # Install all optional packages
+
+For more information, visit:
+https://github.com/yourusername/playbian-auto-typer
+    """
+
+_FALLBACK_VERSION = "Playbian Auto Typer & Clicker v2.1"
+
+def is_frozen():
+    """Check if running from a packaged (PyInstaller/Nuitka) build"""
+    return getattr(sys, 'frozen', False) or hasattr(sys, '_MEIPASS')
+
+def setup_launcher_logging(quiet=False):
+    """Configure launcher console output"""
+    if quiet:
+        level = logging.WARNING
+    else:
+        level = os.environ.get('PLAYBIAN_LOGLEVEL', 'INFO').upper()
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Keep our handler when main_app reconfigures the root logger
+    log.handlers[:] = [handler]
+    log.propagate = False
+    try:
+        log.setLevel(level)
+    except ValueError:
+        log.setLevel(logging.INFO)
+
+def cached_import(module_name, attr=None):
+    """Import a module once and reuse it from sys.modules on later calls"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
 def check_python_version():
     """Check if Python version meets minimum requirements"""
     current_version = sys.version_info[:2]
     if current_version < MIN_PYTHON_VERSION:
-        print(f"❌ Error: Python {MIN_PYTHON_VERSION[0]}.{MIN_PYTHON_VERSION[1]}+ is required.")
-        print(f"   Current version: {current_version[0]}.{current_version[1]}")
-        print(f"   Please upgrade Python and try again.")
+        log.error("❌ Error: Python %s.%s+ is required.", MIN_PYTHON_VERSION[0], MIN_PYTHON_VERSION[1])
+        log.error("   Current version: %s.%s", current_version[0], current_version[1])
+        log.error("   Please upgrade Python and try again.")
         return False
     
-    print(f"✅ Python version {current_version[0]}.{current_version[1]} - OK")
+    log.info("✅ Python version %s.%s - OK", current_version[0], current_version[1])
     return True
 
-def check_package(package_name, install_command=None):
+@lru_cache(maxsize=None)
+def available_modules():
+    """Collect top-level module names on sys.path in a single walk"""
+    return frozenset(module.name for module in pkgutil.iter_modules())
+
+@lru_cache(maxsize=None)
+def check_package(package_name):
     """Check if a package is installed"""
+    if package_name in available_modules():
+        return True
+    
+    # Namespace packages are not listed by iter_modules
+    return importlib.util.find_spec(package_name) is not None
+
+def distribution_present(package_name, package_spec):
+    """Check if a requirement's distribution is installed, ignoring its version"""
+    dist_name = re.match(r'[A-Za-z0-9._-]+', package_spec).group(0)
     try:
-        importlib.import_module(package_name)
+        metadata.version(dist_name)
         return True
+    except metadata.PackageNotFoundError:
+        return check_package(package_name)
+
+@lru_cache(maxsize=None)
+def spec_satisfied(package_name, package_spec):
+    """Check if the installed distribution satisfies a requirement spec"""
+    try:
+        from packaging.requirements import Requirement, InvalidRequirement
     except ImportError:
+        # Without packaging we can only tell whether the package is present
+        return distribution_present(package_name, package_spec)
+    
+    try:
+        requirement = Requirement(package_spec)
+    except InvalidRequirement:
+        log.warning("⚠️  Could not parse requirement '%s'; only checking it is installed", package_spec)
+        return distribution_present(package_name, package_spec)
+    
+    try:
+        installed_version = metadata.version(requirement.name)
+    except metadata.PackageNotFoundError:
         return False
+    
+    return requirement.specifier.contains(installed_version, prereleases=True)
 
-def install_package(package_spec):
-    """Install a package using pip"""
+def pip_supports_dry_run():
+    """Check if pip understands 'install --dry-run' (pip 22.2+)"""
     try:
-        print(f"📦 Installing {package_spec}...")
+        pip_version = metadata.version('pip')
+    except metadata.PackageNotFoundError:
+        return False
+    
+    parts = re.findall(r'\d+', pip_version)[:2]
+    return tuple(int(part) for part in parts) >= (22, 2)
+
+def install_packages(package_specs, verbose=False, probe_only=False):
+    """Install several packages with a single pip invocation
+    
+    With probe_only, pip only resolves the packages without installing them.
+    """
+    specs = ' '.join(package_specs)
+    command = [sys.executable, '-m', 'pip', 'install', '--prefer-binary',
+               '--disable-pip-version-check', *package_specs]
+    download_dir = None
+    
+    if probe_only:
+        if pip_supports_dry_run():
+            command.insert(4, '--dry-run')
+        else:
+            # Older pip: fetch just the requested distributions into a scratch dir
+            download_dir = tempfile.mkdtemp(prefix='playbian_')
+            command = [sys.executable, '-m', 'pip', 'download', '--no-deps',
+                       '--dest', download_dir, *package_specs]
+    
+    if probe_only:
+        log.info("🔍 Checking that %s can be installed...", specs)
+    else:
+        log.info("📦 Installing %s...", specs)
+    
+    try:
+        # pip output streams straight to the console; only stderr is kept for errors
         result = subprocess.run(
-            [sys.executable, '-m', 'pip', 'install', package_spec],
-            capture_output=True,
+            command,
+            stdout=None,
+            stderr=None if verbose else subprocess.PIPE,
             text=True,
-            check=True
+            check=False
         )
-        print(f"✅ Successfully installed {package_spec}")
+    finally:
+        if download_dir:
+            shutil.rmtree(download_dir, ignore_errors=True)
+    
+    if result.returncode != 0:
+        if probe_only:
+            log.error("❌ %s cannot be installed (pip exit code %s)", specs, result.returncode)
+        else:
+            log.error("❌ Failed to install %s (pip exit code %s)", specs, result.returncode)
+        if result.stderr:
+            # Keep only the tail; pip tracebacks can be long
+            log.error("   Error output: %s", result.stderr[-2000:])
+        return False
+    
+    if probe_only:
+        log.info("✅ %s can be installed", specs)
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install {package_spec}: {e}")
-        print(f"   Error output: {e.stderr}")
+    
+    log.info("✅ Successfully installed %s", specs)
+    importlib.invalidate_caches()
+    available_modules.cache_clear()
+    check_package.cache_clear()
+    spec_satisfied.cache_clear()
+    return True
+
+def read_requirements(path, fallback):
+    """Read {name: spec} pairs from a requirements file"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            # Join backslash continuation lines, as pip does
+            lines = re.sub(r'\\\r?\n', ' ', f.read()).splitlines()
+    except OSError:
+        return dict(fallback)
+    
+    requirements = {}
+    for line in lines:
+        spec = line.split('#', 1)[0].strip()
+        
+        # Skip option lines such as -r, -e, -c and --index-url
+        if not spec or spec.startswith('-'):
+            continue
+        
+        # Drop per-requirement options such as --hash
+        spec = spec.split(' --', 1)[0].strip()
+        match = re.match(r'[A-Za-z0-9._-]+', spec)
+        if match:
+            requirements[match.group(0)] = spec
+    return requirements
+
+def deps_stamp_key():
+    """Fingerprint the requirement files and interpreter the last check ran against"""
+    digest = hashlib.sha256()
+    digest.update(sys.executable.encode('utf-8'))
+    digest.update(sys.version.encode('utf-8'))
+    for path in (CORE_REQUIREMENTS_FILE, OPTIONAL_REQUIREMENTS_FILE):
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(path.encode('utf-8'))
+    return digest.hexdigest()
+
+def deps_stamp_path():
+    """Location of the dependency check stamp file"""
+    return os.path.join(cached_import('config').CONFIG_DIR, DEPS_STAMP_NAME)
+
+def deps_stamp_fresh():
+    """Check if dependencies were verified for the current requirements"""
+    try:
+        with open(deps_stamp_path(), 'r', encoding='utf-8') as f:
+            return f.read().strip() == deps_stamp_key()
+    except Exception:
         return False
 
-def check_and_install_dependencies():
-    """Check and install required dependencies"""
-    print("🔍 Checking dependencies...")
+def write_deps_stamp():
+    """Record a successful dependency check"""
+    try:
+        stamp_path = deps_stamp_path()
+        os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+        with open(stamp_path, 'w', encoding='utf-8') as f:
+            f.write(deps_stamp_key())
+    except Exception as e:
+        log.debug("Could not write dependency stamp: %s", e)
+
+def probe_dependencies():
+    """Find missing core and optional packages without installing anything"""
+    log.info("🔍 Checking dependencies...")
     
     missing_core = []
     missing_optional = []
     
     # Check core packages
-    for package_name, package_spec in CORE_PACKAGES.items():
-        if not check_package(package_name):
+    core_packages = read_requirements(CORE_REQUIREMENTS_FILE, CORE_PACKAGES)
+    for package_name, package_spec in core_packages.items():
+        if not spec_satisfied(package_name, package_spec):
             missing_core.append(package_spec)
         else:
-            print(f"✅ {package_name} - OK")
+            log.info("✅ %s - OK", package_name)
     
     # Check optional packages
-    for package_name, package_spec in OPTIONAL_PACKAGES.items():
-        if not check_package(package_name):
+    optional_packages = read_requirements(OPTIONAL_REQUIREMENTS_FILE, OPTIONAL_PACKAGES)
+    for package_name, package_spec in optional_packages.items():
+        if not spec_satisfied(package_name, package_spec):
             missing_optional.append(package_spec)
         else:
-            print(f"✅ {package_name} - OK")
+            log.info("✅ %s - OK", package_name)
+    
+    return missing_core, missing_optional
+
+def want_optional_packages(assume_yes=False):
+    """Decide whether to install optional packages without blocking non-interactive runs"""
+    if assume_yes:
+        return True
+    
+    choice = os.environ.get('PLAYBIAN_INSTALL_OPTIONAL')
+    if choice is not None:
+        return choice.strip().lower() in ('1', 'y', 'yes', 'true')
+    
+    # Only prompt when someone is there to answer; default to no
+    if not sys.stdin or not sys.stdin.isatty():
+        return False
+    
+    response = input("\n🤔 Install optional packages? (y/N): ").strip().lower()
+    return response in ('y', 'yes')
+
+def check_and_install_dependencies(missing=None, verbose=False, assume_yes=False,
+                                   probe_only=False):
+    """Check and install required dependencies
+    
+    With probe_only, missing packages are only checked for installability.
+    """
+    if is_frozen():
+        log.info("✅ Frozen build - skipping dependency check")
+        return True
+    
+    # Reuse probe results when the caller already has them
+    if missing is None:
+        missing = probe_dependencies()
+    missing_core, missing_optional = missing
     
     # Install missing core packages
     if missing_core:
-        print(f"\n📋 Missing core dependencies: {', '.join(missing_core)}")
-        print("🚀 Installing required packages...")
+        log.info("\n📋 Missing core dependencies: %s", ', '.join(missing_core))
+        if not probe_only:
+            log.info("🚀 Installing required packages...")
         
-        for package_spec in missing_core:
-            if not install_package(package_spec):
-                print(f"\n❌ Failed to install core dependency: {package_spec}")
-                print("   Please install manually using:")
-                print(f"   pip install {package_spec}")
-                return False
+        if not install_packages(missing_core, verbose, probe_only):
+            log.error("\n❌ Failed to install core dependencies: %s", ', '.join(missing_core))
+            log.error("   Please install manually using:")
+            log.error("   pip install %s", ' '.join(missing_core))
+            return False
     
     # Optionally install missing optional packages
     if missing_optional:
-        print(f"\n📋 Optional packages not found: {', '.join(missing_optional)}")
-        print("   These packages enable additional features:")
-        print("   - requests: AI integration with Gemini/OpenAI")
-        print("   - psutil: System monitoring and performance stats")
-        print("   - Pillow: Advanced image operations and screenshots")
+        log.info("\n📋 Optional packages not found: %s", ', '.join(missing_optional))
+        log.info("   These packages enable additional features:")
+        log.info("   - requests: AI integration with Gemini/OpenAI")
+        log.info("   - psutil: System monitoring and performance stats")
+        log.info("   - Pillow: Advanced image operations and screenshots")
         
         try:
-            response = input("\n🤔 Install optional packages? (y/N): ").strip().lower()
-            if response in ('y', 'yes'):
-                for package_spec in missing_optional:
-                    install_package(package_spec)
+            if probe_only:
+                install_packages(missing_optional, verbose, probe_only=True)
+            elif want_optional_packages(assume_yes):
+                install_packages(missing_optional, verbose)
         except KeyboardInterrupt:
-            print("\n⏸️  Installation cancelled by user")
+            log.info("\n⏸️  Installation cancelled by user")
+    
+    if not probe_only:
+        write_deps_stamp()
     
-    print("\n✅ Dependency check complete!")
+    log.info("\n✅ Dependency check complete!")
     return True
 
 def check_files():
     """Check if all required application files exist"""
-    required_files = [
+    required_files = {
         'main_app.py',
         'config.py',
         'actions.py',
         'ui_components.py',
         'utils.py'
-    ]
+    }
     
-    missing_files = []
-    for file in required_files:
-        if not Path(file).exists():
-            missing_files.append(file)
+    # Read the directory once instead of stat'ing each file
+    with os.scandir('.') as entries:
+        present_files = {entry.name for entry in entries if entry.is_file()}
+    
+    missing_files = sorted(required_files - present_files)
     
     if missing_files:
-        print(f"❌ Missing required files: {', '.join(missing_files)}")
-        print("   Please ensure all application files are present.")
+        log.error("❌ Missing required files: %s", ', '.join(missing_files))
+        log.error("   Please ensure all application files are present.")
         return False
     
-    print("✅ All required files found")
+    log.info("✅ All required files found")
     return True
 
 def setup_environment():
     """Setup environment and configuration"""
     try:
         # Import config to trigger initial setup
-        import config
+        config = cached_import('config')
         config.ensure_config_dir()
-        print("✅ Configuration directory initialized")
+        log.info("✅ Configuration directory initialized")
         return True
     except Exception as e:
-        print(f"❌ Failed to setup environment: {e}")
+        log.error("❌ Failed to setup environment: %s", e)
         return False
 
 def launch_application():
     """Launch the main application"""
     try:
-        print("🚀 Launching Playbian Auto Typer & Clicker...")
+        log.info("🚀 Launching Playbian Auto Typer & Clicker...")
         
         # Import and run the main application
-        from main_app import main
-        main()
+        cached_import('main_app', 'main')()
         
     except KeyboardInterrupt:
-        print("\n⏸️  Application stopped by user")
+        log.info("\n⏸️  Application stopped by user")
     except Exception as e:
-        print(f"\n❌ Application error: {e}")
-        print("\nFor help, please:")
-        print("1. Check the log files in ~/.playbian_auto_typer/")
-        print("2. Report issues at: https://github.com/yourusername/playbian-auto-typer/issues")
+        log.error("\n❌ Application error: %s", e)
+        log.error("\nFor help, please:")
+        log.error("1. Check the log files in ~/.playbian_auto_typer/")
+        log.error("2. Report issues at: https://github.com/yourusername/playbian-auto-typer/issues")
         return False
     
     return True
 
 def show_banner():
     """Show application banner"""
-    banner = """
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                                                              ║
-    ║         🖱️⌨️  Playbian Auto Typer & Clicker v2.1             ║
-    ║                                                              ║
-    ║              Modern Automation for Everyone                  ║
-    ║                                                              ║
-    ╚══════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    log.info(_BANNER)
 
 def show_help():
     """Show help information"""
-    help_text = """
-Usage: python run.py [options]
-
-Options:
-  --help, -h          Show this help message
-  --check-deps        Only check dependencies, don't launch
-  --install-optional  Install optional packages
-  --version           Show version information
-  --setup             Run setup without launching
-
-Examples:
-  python run.py                    # Normal launch
-  python run.py --check-deps       # Check dependencies only
-  python run.py --install-optional # Install all optional packages
-
-For more information, visit:
-https://github.com/yourusername/playbian-auto-typer
-    """
-    print(help_text)
+    print(_HELP)
 
 def show_version():
     """Show version information"""
     try:
-        from config import APP_NAME, APP_VERSION, APP_AUTHOR
-        print(f"{APP_NAME} v{APP_VERSION}")
-        print(f"Created by {APP_AUTHOR}")
+        config = cached_import('config')
+        print(f"{config.APP_NAME} v{config.APP_VERSION}")
+        print(f"Created by {config.APP_AUTHOR}")
     except ImportError:
-        print("Playbian Auto Typer & Clicker v2.1")
+        print(_FALLBACK_VERSION)
     
     print(f"Python {sys.version}")
     print(f"Platform: {sys.platform}")
 
+def parse_args(argv=None):
+    """Parse launcher command line flags"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--help', '-h', action='store_true')
+    parser.add_argument('--version', action='store_true')
+    parser.add_argument('--check-deps', action='store_true')
+    parser.add_argument('--install-optional', action='store_true')
+    parser.add_argument('--setup', action='store_true')
+    parser.add_argument('--verbose', '-v', action='store_true')
+    parser.add_argument('--quiet', '-q', action='store_true')
+    parser.add_argument('--yes', '-y', action='store_true')
+    
+    # Unknown flags are ignored, as before
+    args, _ = parser.parse_known_args(argv)
+    return args
+
 def main():
     """Main launcher function"""
     # Parse command line arguments
-    args = sys.argv[1:]
+    args = parse_args()
+    setup_launcher_logging(args.quiet)
     
-    if '--help' in args or '-h' in args:
+    if args.help:
         show_banner()
         show_help()
         return
     
-    if '--version' in args:
+    if args.version:
         show_version()
         return
     
     # Show banner
     show_banner()
     
-    # Check Python version
-    if not check_python_version():
-        sys.exit(1)
+    # Run the independent read-only checks concurrently; installs stay serial
+    # Files are bundled into the executable for frozen builds
+    # The stamp is read once; a fresh stamp skips the dependency probe entirely
+    checks = {'python': check_python_version}
+    deps_fresh = False
+    if not is_frozen():
+        checks['files'] = check_files
+        deps_fresh = not args.check_deps and deps_stamp_fresh()
+        if not deps_fresh:
+            checks['deps'] = probe_dependencies
+    
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(check) for name, check in checks.items()}
+    results = {name: future.result() for name, future in futures.items()}
     
-    # Check if files exist
-    if not check_files():
+    if not results['python'] or not results.get('files', True):
         sys.exit(1)
     
+    missing = results.get('deps')
+    
     # Handle special arguments
-    if '--check-deps' in args:
-        check_and_install_dependencies()
-        return
+    if args.check_deps:
+        ok = check_and_install_dependencies(missing, args.verbose, args.yes, probe_only=True)
+        sys.exit(0 if ok else 1)
     
-    if '--install-optional' in args:
+    if args.install_optional:
         # Force install all optional packages
-        print("📦 Installing all optional packages...")
-        for package_spec in OPTIONAL_PACKAGES.values():
-            install_package(package_spec)
+        log.info("📦 Installing all optional packages...")
+        optional_packages = read_requirements(OPTIONAL_REQUIREMENTS_FILE, OPTIONAL_PACKAGES)
+        install_packages(list(optional_packages.values()), args.verbose)
         return
     
-    if '--setup' in args:
-        check_and_install_dependencies()
+    if deps_fresh:
+        log.info("✅ Dependencies unchanged since last check")
+    
+    if args.setup:
+        if not deps_fresh:
+            check_and_install_dependencies(missing, args.verbose, args.yes)
         setup_environment()
-        print("✅ Setup complete! Run 'python run.py' to launch the application.")
+        log.info("✅ Setup complete! Run 'python run.py' to launch the application.")
         return
     
     # Normal launch sequence
-    print("🔧 Preparing to launch...")
+    log.info("🔧 Preparing to launch...")
     
     # Check and install dependencies
-    if not check_and_install_dependencies():
-        print("\n❌ Dependency check failed. Please resolve the issues above.")
+    if not deps_fresh and not check_and_install_dependencies(missing, args.verbose, args.yes):
+        log.error("\n❌ Dependency check failed. Please resolve the issues above.")
         sys.exit(1)
     
     # Setup environment
     if not setup_environment():
-        print("\n❌ Environment setup failed.")
+        log.error("\n❌ Environment setup failed.")
         sys.exit(1)
     
     # Launch application
@@ -281,8 +559,8 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n👋 Goodbye!")
+        log.info("\n👋 Goodbye!")
     except Exception as e:
-        print(f"\n💥 Unexpected error: {e}")
-        print("Please report this issue with the error details above.")
+        log.error("\n💥 Unexpected error: %s", e)
+        log.error("Please report this issue with the error details above.")
         sys.exit(1)
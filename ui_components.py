@@ -4,8 +4,9 @@ Contains all custom UI widgets, styling, and helper classes
 """
 
 import tkinter as tk
-from tkinter import ttk, Menu, messagebox
+from tkinter import ttk
 import time
+import queue
 import logging
 from typing import Callable, Optional, List, Dict, Any
 from config import COLORS, EMOJI, FONTS, ANIMATION, SPECIAL_KEYS
@@ -15,9 +16,14 @@ logger = logging.getLogger(__name__)
 class ModernStyle:
     """Modern dark theme styling for the application"""
     
+    _configured = False
+    
     @staticmethod
-    def setup_styles():
-        """Setup modern dark theme styles"""
+    def setup_styles(force: bool = False):
+        """Setup modern dark theme styles (only once unless forced)"""
+        if ModernStyle._configured and not force:
+            return
+        
         style = ttk.Style()
         
         # Use the most modern theme available
@@ -29,322 +35,368 @@ class ModernStyle:
                 style.theme_use(theme)
                 break
         
-        # Configure main frames
-        style.configure('TFrame', 
-                      background=COLORS['bg_primary'],
-                      borderwidth=0)
-        
-        style.configure('Card.TFrame', 
-                      background=COLORS['bg_secondary'],
-                      borderwidth=1,
-                      relief='solid',
-                      bordercolor=COLORS['border'])
-        
-        style.configure('Glass.TFrame', 
-                      background=COLORS['glass_bg'],
-                      borderwidth=1,
-                      relief='solid',
-                      bordercolor=COLORS['glass_border'])
-        
-        # Configure labelframes
-        style.configure('TLabelframe', 
-                      background=COLORS['bg_primary'],
-                      bordercolor=COLORS['border'],
-                      borderwidth=2,
-                      relief='solid')
-        
-        style.configure('TLabelframe.Label', 
-                      font=FONTS['default'],
-                      foreground=COLORS['text_primary'],
-                      background=COLORS['bg_primary'])
-        
-        style.configure('Card.TLabelframe', 
-                      background=COLORS['bg_secondary'],
-                      bordercolor=COLORS['border_light'],
-                      borderwidth=1,
-                      relief='solid')
-        
-        style.configure('Card.TLabelframe.Label', 
-                      font=FONTS['default'],
-                      foreground=COLORS['text_primary'],
-                      background=COLORS['bg_secondary'])
-        
-        # Configure labels
-        style.configure('TLabel', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_primary'],
-                      foreground=COLORS['text_primary'])
-        
-        style.configure('Heading.TLabel', 
-                      font=FONTS['heading'],
-                      background=COLORS['bg_primary'],
-                      foreground=COLORS['text_primary'])
-        
-        style.configure('Title.TLabel', 
-                      font=FONTS['title'],
-                      background=COLORS['bg_primary'],
-                      foreground=COLORS['accent'])
-        
-        style.configure('Secondary.TLabel', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_primary'],
-                      foreground=COLORS['text_secondary'])
-        
-        style.configure('Card.TLabel', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_secondary'],
-                      foreground=COLORS['text_primary'])
+        # Apply every configure/map setting to the active theme in one call
+        style.theme_settings(style.theme_use(), _STYLE_SETTINGS)
+        style.tk.eval(_TREEVIEW_SCRIPT)
+        ModernStyle._configured = True
+    
+    @staticmethod
+    def build_style_settings() -> Dict[str, Dict[str, Any]]:
+        """Build all style settings in ttk theme_settings format"""
+        settings = {}
+        
+        # Configure frames, labelframes and labels
+        settings.update(ModernStyle._container_settings())
         
         # Configure buttons
-        ModernStyle._configure_buttons(style)
+        settings.update(ModernStyle._button_settings())
         
         # Configure inputs
-        ModernStyle._configure_inputs(style)
+        settings.update(ModernStyle._input_settings())
         
         # Configure treeview
-        ModernStyle._configure_treeview(style)
+        settings.update(ModernStyle._treeview_settings())
         
         # Configure notebook
-        ModernStyle._configure_notebook(style)
+        settings.update(ModernStyle._notebook_settings())
         
         # Configure other widgets
-        ModernStyle._configure_misc_widgets(style)
+        settings.update(ModernStyle._misc_widget_settings())
+        
+        return settings
+    
+    @staticmethod
+    def _container_settings() -> Dict[str, Dict[str, Any]]:
+        """Frame, labelframe and label styles"""
+        return {
+            # Main frames
+            'TFrame': {'configure': {
+                'background': COLORS['bg_primary'],
+                'borderwidth': 0}},
+            
+            'Card.TFrame': {'configure': {
+                'background': COLORS['bg_secondary'],
+                'borderwidth': 1,
+                'relief': 'solid',
+                'bordercolor': COLORS['border']}},
+            
+            'Glass.TFrame': {'configure': {
+                'background': COLORS['glass_bg'],
+                'borderwidth': 1,
+                'relief': 'solid',
+                'bordercolor': COLORS['glass_border']}},
+            
+            # Labelframes
+            'TLabelframe': {'configure': {
+                'background': COLORS['bg_primary'],
+                'bordercolor': COLORS['border'],
+                'borderwidth': 2,
+                'relief': 'solid'}},
+            
+            'TLabelframe.Label': {'configure': {
+                'font': FONTS['default'],
+                'foreground': COLORS['text_primary'],
+                'background': COLORS['bg_primary']}},
+            
+            'Card.TLabelframe': {'configure': {
+                'background': COLORS['bg_secondary'],
+                'bordercolor': COLORS['border_light'],
+                'borderwidth': 1,
+                'relief': 'solid'}},
+            
+            'Card.TLabelframe.Label': {'configure': {
+                'font': FONTS['default'],
+                'foreground': COLORS['text_primary'],
+                'background': COLORS['bg_secondary']}},
+            
+            # Labels
+            'TLabel': {'configure': {
+                'font': FONTS['default'],
+                'background': COLORS['bg_primary'],
+                'foreground': COLORS['text_primary']}},
+            
+            'Heading.TLabel': {'configure': {
+                'font': FONTS['heading'],
+                'background': COLORS['bg_primary'],
+                'foreground': COLORS['text_primary']}},
+            
+            'Title.TLabel': {'configure': {
+                'font': FONTS['title'],
+                'background': COLORS['bg_primary'],
+                'foreground': COLORS['accent']}},
+            
+            'Secondary.TLabel': {'configure': {
+                'font': FONTS['default'],
+                'background': COLORS['bg_primary'],
+                'foreground': COLORS['text_secondary']}},
+            
+            'Card.TLabel': {'configure': {
+                'font': FONTS['default'],
+                'background': COLORS['bg_secondary'],
+                'foreground': COLORS['text_primary']}},
+        }
     
     @staticmethod
-    def _configure_buttons(style):
-        """Configure button styles"""
-        # Base button
-        style.configure('TButton', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_secondary'],
-                      foreground=COLORS['text_primary'],
-                      bordercolor=COLORS['border'],
-                      focuscolor=COLORS['accent'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=(12, 8))
-        
-        style.map('TButton',
-                background=[('pressed', COLORS['border']), 
-                          ('active', COLORS['bg_tertiary'])],
-                foreground=[('pressed', COLORS['text_primary']), 
-                          ('active', COLORS['text_primary'])],
-                bordercolor=[('active', COLORS['accent'])])
-        
-        # Primary button
-        style.configure('Primary.TButton', 
-                      font=FONTS['default'],
-                      background=COLORS['accent'],
-                      foreground='white',
-                      bordercolor=COLORS['accent_hover'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=(12, 8))
-        
-        style.map('Primary.TButton',
-                background=[('pressed', COLORS['accent_hover']), 
-                          ('active', COLORS['accent_light'])],
-                foreground=[('pressed', 'white'), ('active', 'white')])
-        
-        # Success button
-        style.configure('Success.TButton', 
-                      font=FONTS['default'],
-                      background=COLORS['success'],
-                      foreground='white',
-                      bordercolor=COLORS['success_hover'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=(12, 8))
-        
-        style.map('Success.TButton',
-                background=[('pressed', COLORS['success_hover']), 
-                          ('active', COLORS['success_hover'])],
-                foreground=[('pressed', 'white'), ('active', 'white')])
-        
-        # Danger button
-        style.configure('Danger.TButton', 
-                      font=FONTS['default'],
-                      background=COLORS['danger'],
-                      foreground='white',
-                      bordercolor=COLORS['danger_hover'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=(12, 8))
-        
-        style.map('Danger.TButton',
-                background=[('pressed', COLORS['danger_hover']), 
-                          ('active', COLORS['danger_hover'])],
-                foreground=[('pressed', 'white'), ('active', 'white')])
-        
-        # Small button
-        style.configure('Small.TButton', 
-                      font=FONTS['small'],
-                      background=COLORS['bg_secondary'],
-                      foreground=COLORS['text_primary'],
-                      bordercolor=COLORS['border'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=(8, 4))
-        
-        style.map('Small.TButton',
-                background=[('pressed', COLORS['border']), 
-                          ('active', COLORS['bg_tertiary'])],
-                bordercolor=[('active', COLORS['accent'])])
+    def _button_settings() -> Dict[str, Dict[str, Any]]:
+        """Button styles"""
+        return {
+            # Base button
+            'TButton': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'background': COLORS['bg_secondary'],
+                    'foreground': COLORS['text_primary'],
+                    'bordercolor': COLORS['border'],
+                    'focuscolor': COLORS['accent'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': (12, 8)},
+                'map': {
+                    'background': [('pressed', COLORS['border']),
+                                   ('active', COLORS['bg_tertiary'])],
+                    'foreground': [('pressed', COLORS['text_primary']),
+                                   ('active', COLORS['text_primary'])],
+                    'bordercolor': [('active', COLORS['accent'])]}},
+            
+            # Primary button
+            'Primary.TButton': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'background': COLORS['accent'],
+                    'foreground': 'white',
+                    'bordercolor': COLORS['accent_hover'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': (12, 8)},
+                'map': {
+                    'background': [('pressed', COLORS['accent_hover']),
+                                   ('active', COLORS['accent_light'])],
+                    'foreground': [('pressed', 'white'), ('active', 'white')]}},
+            
+            # Success button
+            'Success.TButton': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'background': COLORS['success'],
+                    'foreground': 'white',
+                    'bordercolor': COLORS['success_hover'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': (12, 8)},
+                'map': {
+                    'background': [('pressed', COLORS['success_hover']),
+                                   ('active', COLORS['success_hover'])],
+                    'foreground': [('pressed', 'white'), ('active', 'white')]}},
+            
+            # Danger button
+            'Danger.TButton': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'background': COLORS['danger'],
+                    'foreground': 'white',
+                    'bordercolor': COLORS['danger_hover'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': (12, 8)},
+                'map': {
+                    'background': [('pressed', COLORS['danger_hover']),
+                                   ('active', COLORS['danger_hover'])],
+                    'foreground': [('pressed', 'white'), ('active', 'white')]}},
+            
+            # Small button
+            'Small.TButton': {
+                'configure': {
+                    'font': FONTS['small'],
+                    'background': COLORS['bg_secondary'],
+                    'foreground': COLORS['text_primary'],
+                    'bordercolor': COLORS['border'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': (8, 4)},
+                'map': {
+                    'background': [('pressed', COLORS['border']),
+                                   ('active', COLORS['bg_tertiary'])],
+                    'bordercolor': [('active', COLORS['accent'])]}},
+        }
     
     @staticmethod
-    def _configure_inputs(style):
-        """Configure input widget styles"""
-        # Entry
-        style.configure('TEntry', 
-                      font=FONTS['default'],
-                      fieldbackground=COLORS['input_bg'],
-                      foreground=COLORS['text_primary'],
-                      bordercolor=COLORS['input_border'],
-                      insertcolor=COLORS['text_primary'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=8)
-        
-        style.map('TEntry',
-                bordercolor=[('focus', COLORS['input_focus'])])
-        
-        # Spinbox
-        style.configure('TSpinbox', 
-                      font=FONTS['default'],
-                      fieldbackground=COLORS['input_bg'],
-                      foreground=COLORS['text_primary'],
-                      bordercolor=COLORS['input_border'],
-                      arrowcolor=COLORS['text_primary'],
-                      insertcolor=COLORS['text_primary'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=8)
-        
-        style.map('TSpinbox',
-                bordercolor=[('focus', COLORS['input_focus'])])
-        
-        # Combobox
-        style.configure('TCombobox', 
-                      font=FONTS['default'],
-                      fieldbackground=COLORS['input_bg'],
-                      foreground=COLORS['text_primary'],
-                      bordercolor=COLORS['input_border'],
-                      arrowcolor=COLORS['text_primary'],
-                      insertcolor=COLORS['text_primary'],
-                      relief='solid',
-                      borderwidth=1,
-                      padding=8)
-        
-        style.map('TCombobox',
-                bordercolor=[('focus', COLORS['input_focus'])])
-        
-        # Checkbutton
-        style.configure('TCheckbutton', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_primary'],
-                      foreground=COLORS['text_primary'],
-                      focuscolor=COLORS['accent'])
-        
-        # Radiobutton
-        style.configure('TRadiobutton', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_primary'],
-                      foreground=COLORS['text_primary'],
-                      focuscolor=COLORS['accent'])
+    def _input_settings() -> Dict[str, Dict[str, Any]]:
+        """Input widget styles"""
+        return {
+            # Entry
+            'TEntry': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'fieldbackground': COLORS['input_bg'],
+                    'foreground': COLORS['text_primary'],
+                    'bordercolor': COLORS['input_border'],
+                    'insertcolor': COLORS['text_primary'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': 8},
+                'map': {
+                    'bordercolor': [('focus', COLORS['input_focus'])]}},
+            
+            # Spinbox
+            'TSpinbox': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'fieldbackground': COLORS['input_bg'],
+                    'foreground': COLORS['text_primary'],
+                    'bordercolor': COLORS['input_border'],
+                    'arrowcolor': COLORS['text_primary'],
+                    'insertcolor': COLORS['text_primary'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': 8},
+                'map': {
+                    'bordercolor': [('focus', COLORS['input_focus'])]}},
+            
+            # Combobox
+            'TCombobox': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'fieldbackground': COLORS['input_bg'],
+                    'foreground': COLORS['text_primary'],
+                    'bordercolor': COLORS['input_border'],
+                    'arrowcolor': COLORS['text_primary'],
+                    'insertcolor': COLORS['text_primary'],
+                    'relief': 'solid',
+                    'borderwidth': 1,
+                    'padding': 8},
+                'map': {
+                    'bordercolor': [('focus', COLORS['input_focus'])]}},
+            
+            # Checkbutton
+            'TCheckbutton': {'configure': {
+                'font': FONTS['default'],
+                'background': COLORS['bg_primary'],
+                'foreground': COLORS['text_primary'],
+                'focuscolor': COLORS['accent']}},
+            
+            # Radiobutton
+            'TRadiobutton': {'configure': {
+                'font': FONTS['default'],
+                'background': COLORS['bg_primary'],
+                'foreground': COLORS['text_primary'],
+                'focuscolor': COLORS['accent']}},
+        }
     
     @staticmethod
-    def _configure_treeview(style):
-        """Configure treeview styles"""
-        style.configure('Treeview', 
-                      font=FONTS['default'],
-                      background=COLORS['tree_bg'],
-                      foreground=COLORS['text_primary'],
-                      fieldbackground=COLORS['tree_bg'],
-                      bordercolor=COLORS['border'],
-                      borderwidth=1,
-                      relief='solid',
-                      rowheight=32)
-        
-        style.configure('Treeview.Heading', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_tertiary'],
-                      foreground=COLORS['text_primary'],
-                      borderwidth=1,
-                      relief='solid',
-                      padding=(8, 6))
-        
-        style.map('Treeview',
-                background=[('selected', COLORS['tree_select'])],
-                foreground=[('selected', 'white')])
-        
-        style.map('Treeview.Heading',
-                background=[('active', COLORS['accent']),
-                          ('pressed', COLORS['accent_hover'])],
-                foreground=[('active', 'white'),
-                          ('pressed', 'white')])
-        
-        # Action-specific treeview styles
-        for action_type in ['type', 'click', 'delay', 'hotkey']:
-            style.map(f'{action_type}_action.Treeview',
-                    background=[('selected', COLORS['tree_select']), 
-                              ('', COLORS[f'{action_type}_action'])],
-                    foreground=[('selected', 'white'), 
-                              ('', COLORS['text_primary'])])
+    def _treeview_settings() -> Dict[str, Dict[str, Any]]:
+        """Treeview styles"""
+        settings = {
+            'Treeview': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'background': COLORS['tree_bg'],
+                    'foreground': COLORS['text_primary'],
+                    'fieldbackground': COLORS['tree_bg'],
+                    'bordercolor': COLORS['border'],
+                    'borderwidth': 1,
+                    'relief': 'solid',
+                    'rowheight': 32},
+                'map': {
+                    'background': [('selected', COLORS['tree_select'])],
+                    'foreground': [('selected', 'white')]}},
+            
+            'Treeview.Heading': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'background': COLORS['bg_tertiary'],
+                    'foreground': COLORS['text_primary'],
+                    'borderwidth': 1,
+                    'relief': 'solid',
+                    'padding': (8, 6)},
+                'map': {
+                    'background': [('active', COLORS['accent']),
+                                   ('pressed', COLORS['accent_hover'])],
+                    'foreground': [('active', 'white'),
+                                   ('pressed', 'white')]}},
+        }
+        
+        return settings
     
     @staticmethod
-    def _configure_notebook(style):
-        """Configure notebook styles"""
-        style.configure('TNotebook', 
-                      background=COLORS['bg_primary'],
-                      bordercolor=COLORS['border'],
-                      tabmargins=[2, 5, 2, 0])
-        
-        style.configure('TNotebook.Tab', 
-                      font=FONTS['default'],
-                      background=COLORS['bg_secondary'],
-                      foreground=COLORS['text_primary'],
-                      bordercolor=COLORS['border'],
-                      padding=[12, 8],
-                      focuscolor=COLORS['accent'])
-        
-        style.map('TNotebook.Tab',
-                background=[('selected', COLORS['bg_primary']), 
-                          ('active', COLORS['bg_tertiary'])],
-                foreground=[('selected', COLORS['accent']), 
-                          ('active', COLORS['text_primary'])],
-                bordercolor=[('selected', COLORS['accent'])])
+    def _action_treeview_script() -> str:
+        """Tcl loop mapping the action-specific treeview styles"""
+        pairs = ' '.join(f"{t} {COLORS[f'{t}_action']}"
+                         for t in ('type', 'click', 'delay', 'hotkey'))
+        return (f"foreach {{t bg}} {{{pairs}}} {{\n"
+                f"    ttk::style map ${{t}}_action.Treeview"
+                f" -background [list selected {COLORS['tree_select']} {{}} $bg]"
+                f" -foreground [list selected white {{}} {COLORS['text_primary']}]\n"
+                f"}}")
+    
+    @staticmethod
+    def _notebook_settings() -> Dict[str, Dict[str, Any]]:
+        """Notebook styles"""
+        return {
+            'TNotebook': {'configure': {
+                'background': COLORS['bg_primary'],
+                'bordercolor': COLORS['border'],
+                'tabmargins': [2, 5, 2, 0]}},
+            
+            'TNotebook.Tab': {
+                'configure': {
+                    'font': FONTS['default'],
+                    'background': COLORS['bg_secondary'],
+                    'foreground': COLORS['text_primary'],
+                    'bordercolor': COLORS['border'],
+                    'padding': [12, 8],
+                    'focuscolor': COLORS['accent']},
+                'map': {
+                    'background': [('selected', COLORS['bg_primary']),
+                                   ('active', COLORS['bg_tertiary'])],
+                    'foreground': [('selected', COLORS['accent']),
+                                   ('active', COLORS['text_primary'])],
+                    'bordercolor': [('selected', COLORS['accent'])]}},
+        }
     
     @staticmethod
-    def _configure_misc_widgets(style):
-        """Configure miscellaneous widget styles"""
-        # Separator
-        style.configure('TSeparator', 
-                      background=COLORS['border'])
-        
-        # Progressbar
-        style.configure('TProgressbar',
-                      background=COLORS['accent'],
-                      troughcolor=COLORS['bg_secondary'],
-                      bordercolor=COLORS['border'],
-                      lightcolor=COLORS['accent'],
-                      darkcolor=COLORS['accent'])
-        
-        # Scale
-        style.configure('TScale',
-                      background=COLORS['bg_primary'],
-                      troughcolor=COLORS['bg_secondary'],
-                      bordercolor=COLORS['border'],
-                      slidercolor=COLORS['accent'])
+    def _misc_widget_settings() -> Dict[str, Dict[str, Any]]:
+        """Miscellaneous widget styles"""
+        return {
+            # Separator
+            'TSeparator': {'configure': {
+                'background': COLORS['border']}},
+            
+            # Progressbar
+            'TProgressbar': {'configure': {
+                'background': COLORS['accent'],
+                'troughcolor': COLORS['bg_secondary'],
+                'bordercolor': COLORS['border'],
+                'lightcolor': COLORS['accent'],
+                'darkcolor': COLORS['accent']}},
+            
+            # Scale
+            'TScale': {'configure': {
+                'background': COLORS['bg_primary'],
+                'troughcolor': COLORS['bg_secondary'],
+                'bordercolor': COLORS['border'],
+                'slidercolor': COLORS['accent']}},
+        }
+
+# Style settings built once at import and reused by each setup_styles() call
+_STYLE_SETTINGS = ModernStyle.build_style_settings()
+_TREEVIEW_SCRIPT = ModernStyle._action_treeview_script()
 
 class ToolTip:
     """Enhanced tooltip with animation and modern styling"""
     
+    # Whether the window system accepts -alpha; probed on the first tooltip
+    _fade_supported = None
+    
     def __init__(self, widget, text: str, delay: int = ANIMATION['tooltip_delay']):
         self.widget = widget
         self.text = text
         self.delay = delay
         self.tooltip = None
         self.after_id = None
+        self._fade_step = 0
+        self._last_pos_update = 0
+        self._pending_pos = None
+        self._move_after_id = None  # Trailing update for throttled motion
         
         self.widget.bind("<Enter>", self._on_enter)
         self.widget.bind("<Leave>", self._on_leave)
@@ -407,23 +459,36 @@ class ToolTip:
                         pady=4)
         label.pack()
         
-        # Animate tooltip appearance
-        self.tooltip.attributes('-alpha', 0.0)
-        self._fade_in()
-    
-    def _fade_in(self, alpha: float = 0.0):
-        """Fade in animation for tooltip"""
-        alpha += 0.1
-        if alpha <= 1.0 and self.tooltip:
+        # Animate tooltip appearance where transparency is supported
+        if ToolTip._fade_supported is not False:
             try:
-                self.tooltip.attributes('-alpha', alpha)
-                self.tooltip.after(ANIMATION['fade_delay'], 
-                                 lambda: self._fade_in(alpha))
+                self.tooltip.attributes('-alpha', 0.0)
+                ToolTip._fade_supported = True
             except tk.TclError:
-                pass
+                ToolTip._fade_supported = False
+        
+        if ToolTip._fade_supported:
+            self._fade_step = 0
+            self._fade_in()
+    
+    def _fade_in(self):
+        """Fade in animation for tooltip"""
+        if not self.tooltip:
+            return
+        
+        self._fade_step += 1
+        try:
+            self.tooltip.attributes('-alpha', self._fade_step / ANIMATION['fade_steps'])
+            if self._fade_step < ANIMATION['fade_steps']:
+                self.tooltip.after(ANIMATION['fade_delay'], self._fade_in)
+        except tk.TclError:
+            pass
     
     def _hide_tooltip(self):
         """Hide the tooltip"""
+        if self._move_after_id:
+            self.widget.after_cancel(self._move_after_id)
+            self._move_after_id = None
         if self.tooltip:
             try:
                 self.tooltip.destroy()
@@ -434,22 +499,48 @@ class ToolTip:
     def _update_position(self, event):
         """Update tooltip position based on mouse movement"""
         if self.tooltip:
-            x = event.x_root + 20
-            y = event.y_root + 5
-            try:
-                self.tooltip.wm_geometry(f"+{x}+{y}")
-            except tk.TclError:
-                pass
+            self._pending_pos = (event.x_root + 20, event.y_root + 5)
+            
+            # Move at most ~33 times a second during fast mouse movement;
+            # a trailing update makes sure the last position is applied
+            if time.monotonic() - self._last_pos_update < 0.03:
+                if not self._move_after_id:
+                    self._move_after_id = self.widget.after(30, self._apply_position)
+                return
+            self._apply_position()
+    
+    def _apply_position(self):
+        """Move the tooltip to the most recent mouse position"""
+        self._move_after_id = None
+        if not self.tooltip or not self._pending_pos:
+            return
+        
+        self._last_pos_update = time.monotonic()
+        x, y = self._pending_pos
+        try:
+            self.tooltip.wm_geometry(f"+{x}+{y}")
+        except tk.TclError:
+            pass
 
 class StatusBar(ttk.Frame):
     """Enhanced status bar with icons and animations"""
     
+    # Status type -> (icon, COLORS key)
+    _STATUS_ICONS = {
+        "info": ("ℹ️", 'info'),
+        "success": ("✓", 'success'),
+        "warning": ("⚠️", 'warning'),
+        "error": ("✗", 'danger'),
+        "running": ("▶️", 'accent')
+    }
+    
     def __init__(self, parent):
         super().__init__(parent, style='Card.TFrame')
         
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
         self.last_update = time.time()
+        self._clear_after_id = None
         
         # Status icon and text
         self.icon_label = ttk.Label(self, text="✓", 
@@ -479,33 +570,38 @@ class StatusBar(ttk.Frame):
                                   style='Card.TLabel')
         self.time_label.pack(side='right', padx=4, pady=4)
         
+        # Clock only ticks while the window is mapped
+        self._time_after = None
+        self._last_time_str = None
+        toplevel = self.winfo_toplevel()
+        toplevel.bind('<Map>', self._on_map, add='+')
+        toplevel.bind('<Unmap>', self._on_unmap, add='+')
+        
         self._update_time()
     
     def set_status(self, text: str, status_type: str = "info"):
         """Set status with icon based on type"""
-        icons = {
-            "info": ("ℹ️", COLORS['info']),
-            "success": ("✓", COLORS['success']),
-            "warning": ("⚠️", COLORS['warning']),
-            "error": ("✗", COLORS['danger']),
-            "running": ("▶️", COLORS['accent'])
-        }
-        
-        icon, color = icons.get(status_type, ("ℹ️", COLORS['info']))
+        icon, color_key = self._STATUS_ICONS.get(status_type, self._STATUS_ICONS["info"])
+        color = COLORS[color_key]
         
         self.icon_label.config(text=icon, foreground=color)
         self.status_var.set(text)
         self.last_update = time.time()
-        self.update_idletasks()
+        
+        # Replace any pending auto-clear rather than stacking another one
+        if self._clear_after_id:
+            self.after_cancel(self._clear_after_id)
+            self._clear_after_id = None
         
         # Auto-clear status after timeout (except for running status)
         if status_type != "running":
-            self.after(ANIMATION['status_timeout'], self._auto_clear_status)
+            self._clear_after_id = self.after(ANIMATION['status_timeout'], self._auto_clear_status)
         
         logger.info(f"Status updated: {text} ({status_type})")
     
     def _auto_clear_status(self):
         """Auto-clear status if it hasn't been updated recently"""
+        self._clear_after_id = None
         if time.time() - self.last_update >= ANIMATION['status_timeout'] / 1000:
             self.set_status("Ready", "success")
     
@@ -513,20 +609,61 @@ class StatusBar(ttk.Frame):
         """Update mouse position display"""
         self.position_var.set(f"Mouse: ({x}, {y})")
     
+    def _on_map(self, event):
+        """Resume the clock when the window is shown again"""
+        if event.widget is self.winfo_toplevel() and self._time_after is None:
+            self._update_time()
+    
+    def _on_unmap(self, event):
+        """Stop the clock while the window is minimized or hidden"""
+        if event.widget is self.winfo_toplevel() and self._time_after is not None:
+            self.after_cancel(self._time_after)
+            self._time_after = None
+    
     def _update_time(self):
         """Update time display"""
         current_time = time.strftime("%H:%M:%S")
-        self.time_var.set(current_time)
-        self.after(1000, self._update_time)
+        if current_time != self._last_time_str:
+            self.time_var.set(current_time)
+            self._last_time_str = current_time
+        self._time_after = self.after(1000, self._update_time)
 
 class ActionListView(ttk.Frame):
     """Enhanced action list with drag-drop and context menu"""
     
+    # Action class name -> icon
+    _ACTION_ICONS = {
+        'TypeAction': EMOJI['keyboard'],
+        'ClickAction': EMOJI['mouse'],
+        'DelayAction': EMOJI['delay'],
+        'HotkeyAction': EMOJI['hotkey'],
+        'SpecialKeyAction': EMOJI['keyboard'],
+        'ScrollAction': '🖱️',
+        'DragAction': '🖱️'
+    }
+    
+    # Row tag -> background color, resolved once for the known action types
+    _TAG_BG_CACHE = {
+        f"{name.replace('Action', '').lower()}_action":
+            COLORS.get(f"{name.replace('Action', '').lower()}_action", COLORS['bg_secondary'])
+        for name in _ACTION_ICONS
+    }
+    
+    # Action class name -> details formatter
+    _DETAIL_FORMATTERS = {
+        'TypeAction': lambda a: f"'{a.text[:50]}{'...' if len(a.text) > 50 else ''}'",
+        'ClickAction': lambda a: f"{a.button} click at ({a.x}, {a.y})",
+        'ScrollAction': lambda a: f"Position ({a.x}, {a.y})",
+        'HotkeyAction': lambda a: f"Keys: {'+'.join(a.keys)}",
+        'SpecialKeyAction': lambda a: f"Key: {a.key}",
+        'DelayAction': lambda a: f"Wait {a.wait_time} seconds",
+    }
+    
     def __init__(self, parent, callback: Callable):
         super().__init__(parent, style='Card.TFrame')
         self.callback = callback
         self.actions = []
-        self.configured_tags = set()  # Track configured tags
+        self._item_index: Dict[str, int] = {}  # Tree item id -> action index
         
         # Create treeview with columns
         columns = ('Icon', 'Action', 'Details', 'Delay')
@@ -543,19 +680,17 @@ class ActionListView(ttk.Frame):
         self.tree.column('Details', width=300, minwidth=200)
         self.tree.column('Delay', width=80, minwidth=60, anchor='center')
         
+        # Configure row tags for every known action type once
+        for action_tag, bg_color in self._TAG_BG_CACHE.items():
+            self.tree.tag_configure(action_tag, background=bg_color)
+        
         # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(self, orient='horizontal', command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.v_scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.tree.yview)
+        self.h_scrollbar = ttk.Scrollbar(self, orient='horizontal', command=self.tree.xview)
+        self.tree.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
         
-        # Pack widgets
-        self.tree.grid(row=0, column=0, sticky='nsew', padx=2, pady=2)
-        v_scrollbar.grid(row=0, column=1, sticky='ns', pady=2)
-        h_scrollbar.grid(row=1, column=0, sticky='ew', padx=2)
-        
-        # Configure grid weights
-        self.grid_rowconfigure(0, weight=1)
-        self.grid_columnconfigure(0, weight=1)
+        # Widgets are gridded when the first actions arrive
+        self._laid_out = False
         
         # Bind events
         self.tree.bind("<Double-1>", self._on_double_click)
@@ -569,11 +704,12 @@ class ActionListView(ttk.Frame):
         # Drag and drop state
         self.drag_data = {"item": None, "start_index": None}
         
-        # Create context menu
-        self._create_context_menu()
+        # Context menu is created on first right-click
+        self.context_menu = None
     
     def _create_context_menu(self):
         """Create right-click context menu"""
+        from tkinter import Menu
         self.context_menu = Menu(self, tearoff=0)
         self.context_menu.configure(
             bg=COLORS['bg_secondary'],
@@ -612,78 +748,60 @@ class ActionListView(ttk.Frame):
             accelerator="Delete"
         )
     
+    def _layout(self):
+        """Grid the tree and scrollbars"""
+        self.tree.grid(row=0, column=0, sticky='nsew', padx=2, pady=2)
+        self.v_scrollbar.grid(row=0, column=1, sticky='ns', pady=2)
+        self.h_scrollbar.grid(row=1, column=0, sticky='ew', padx=2)
+        
+        # Configure grid weights
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self._laid_out = True
+    
     def update_actions(self, actions: List):
         """Update the list with new actions"""
         self.actions = actions
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if not self._laid_out and actions:
+            self._layout()
         
-        # Add actions to tree
-        for i, action in enumerate(actions):
-            self._add_action_to_tree(action, i)
+        # Clear existing items in a single call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        
+        # Add actions to tree, remembering each row's index
+        self._item_index = {
+            self._add_action_to_tree(action, i): i
+            for i, action in enumerate(actions)
+        }
         
         logger.debug(f"Updated action list with {len(actions)} actions")
     
-    def _add_action_to_tree(self, action, index: int):
-        """Add a single action to the tree"""
+    def _add_action_to_tree(self, action, index: int) -> str:
+        """Add a single action to the tree and return its item id"""
         # Get action icon and details
-        icon = self._get_action_icon(action)
-        action_type = action.__class__.__name__.replace('Action', '')
-        details = self._get_action_details(action)
-        delay = getattr(action, 'delay', 0)
-        
-        # Special handling for DelayAction
-        if hasattr(action, 'wait_time'):
-            delay = action.wait_time
-        
-        # Insert into tree
-        item = self.tree.insert('', 'end', values=(icon, action_type, details, delay))
-        
-        # Apply action-specific styling
+        class_name = type(action).__name__
+        icon = self._ACTION_ICONS.get(class_name, '❓')
+        action_type = class_name.replace('Action', '')
+        details = self._DETAIL_FORMATTERS.get(class_name, str)(action)
+        delay = action.display_delay
+        
+        # Insert with values and action-specific tag in one Tcl call
+        # (direct call skips Treeview.insert's option handling)
         action_tag = f"{action_type.lower()}_action"
-        self.tree.set(item, 'Icon', icon)
-        
-        # Configure tags for visual distinction
-        if action_tag not in self.configured_tags:
-            bg_color = COLORS.get(f'{action_type.lower()}_action', COLORS['bg_secondary'])
-            self.tree.tag_configure(action_tag, background=bg_color)
-            self.configured_tags.add(action_tag)
-        
-        self.tree.item(item, tags=(action_tag,))
+        return self.tree.tk.call(self.tree._w, 'insert', '', 'end',
+                                 '-values', (icon, action_type, details, delay),
+                                 '-tags', (action_tag,))
     
     def _get_action_icon(self, action) -> str:
         """Get appropriate icon for action type"""
-        action_icons = {
-            'TypeAction': EMOJI['keyboard'],
-            'ClickAction': EMOJI['mouse'],
-            'DelayAction': EMOJI['delay'],
-            'HotkeyAction': EMOJI['hotkey'],
-            'SpecialKeyAction': EMOJI['keyboard'],
-            'ScrollAction': '🖱️',
-            'DragAction': '🖱️'
-        }
-        return action_icons.get(action.__class__.__name__, '❓')
+        return self._ACTION_ICONS.get(action.__class__.__name__, '❓')
     
     def _get_action_details(self, action) -> str:
         """Get formatted details for action"""
-        if hasattr(action, 'text'):
-            text = action.text[:50]
-            return f"'{text}{'...' if len(action.text) > 50 else ''}'"
-        elif hasattr(action, 'x') and hasattr(action, 'y'):
-            if hasattr(action, 'button'):
-                return f"{action.button} click at ({action.x}, {action.y})"
-            else:
-                return f"Position ({action.x}, {action.y})"
-        elif hasattr(action, 'keys'):
-            return f"Keys: {'+'.join(action.keys)}"
-        elif hasattr(action, 'key'):
-            return f"Key: {action.key}"
-        elif hasattr(action, 'wait_time'):
-            return f"Wait {action.wait_time} seconds"
-        else:
-            return str(action)
+        return self._DETAIL_FORMATTERS.get(type(action).__name__, str)(action)
     
     def get_selected_index(self) -> Optional[int]:
         """Get index of selected item"""
@@ -691,13 +809,12 @@ class ActionListView(ttk.Frame):
         if not selection:
             return None
         
-        item = selection[0]
-        return self.tree.index(item)
+        return self._item_index.get(selection[0])
     
     def select_item(self, index: int):
         """Select item by index"""
-        if 0 <= index < len(self.tree.get_children()):
-            items = self.tree.get_children()
+        items = self.tree.get_children()
+        if 0 <= index < len(items):
             self.tree.selection_set(items[index])
             self.tree.see(items[index])
     
@@ -711,6 +828,8 @@ class ActionListView(ttk.Frame):
         item = self.tree.identify_row(event.y)
         if item:
             self.tree.selection_set(item)
+            if self.context_menu is None:
+                self._create_context_menu()
             self.context_menu.post(event.x_root, event.y_root)
     
     def _on_press(self, event):
@@ -718,7 +837,7 @@ class ActionListView(ttk.Frame):
         item = self.tree.identify_row(event.y)
         if item:
             self.drag_data["item"] = item
-            self.drag_data["start_index"] = self.tree.index(item)
+            self.drag_data["start_index"] = self._item_index.get(item)
     
     def _on_motion(self, event):
         """Handle mouse motion for drag operation"""
@@ -730,7 +849,7 @@ class ActionListView(ttk.Frame):
         if self.drag_data["item"]:
             target = self.tree.identify_row(event.y)
             if target and target != self.drag_data["item"]:
-                target_index = self.tree.index(target)
+                target_index = self._item_index.get(target)
                 start_index = self.drag_data["start_index"]
                 self.callback("move", start_index, target_index)
             
@@ -785,19 +904,21 @@ class ProgressDialog:
         self.parent = parent
         self.cancelled = False
         
+        # Redraws are coalesced to at most one per ~33ms
+        self._refresh_pending = False
+        self._last_draw = 0
+        
         # Create dialog
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry("400x150")
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center dialog
-        self.dialog.update_idletasks()
+        # Size and center dialog (screen size needs no layout pass)
         x = (self.dialog.winfo_screenwidth() // 2) - 200
         y = (self.dialog.winfo_screenheight() // 2) - 75
-        self.dialog.geometry(f"+{x}+{y}")
+        self.dialog.geometry(f"400x150+{x}+{y}")
         
         # Configure dialog
         self.dialog.configure(bg=COLORS['bg_primary'])
@@ -805,6 +926,10 @@ class ProgressDialog:
         
         # Create content
         self._create_content()
+        
+        # Updates posted from worker threads are applied by the Tk thread
+        self._updates = queue.Queue()
+        self._drain_after = self.dialog.after(50, self._drain)
     
     def _create_content(self):
         """Create dialog content"""
@@ -837,15 +962,65 @@ class ProgressDialog:
         self.progress['value'] = value
         if status:
             self.status_var.set(status)
-        self.dialog.update_idletasks()
+        
+        if self._refresh_pending:
+            return
+        
+        # Redraw now if the last one was long enough ago, otherwise once shortly
+        if time.monotonic() - self._last_draw >= 0.033:
+            self._flush()
+        else:
+            self._refresh_pending = True
+            self.dialog.after(33, self._flush)
+    
+    def post(self, value: float, status: str = ""):
+        """Queue a progress update (safe to call from worker threads)"""
+        self._updates.put_nowait((value, status))
+    
+    def _drain(self):
+        """Apply the latest queued progress update"""
+        value = None
+        status = ""
+        while True:
+            try:
+                value, text = self._updates.get_nowait()
+            except queue.Empty:
+                break
+            if text:
+                status = text
+        
+        # Runs inside the event loop, so Tk redraws on its own afterwards
+        if value is not None:
+            self.progress['value'] = value
+            if status:
+                self.status_var.set(status)
+        
+        self._drain_after = self.dialog.after(50, self._drain)
+    
+    def _flush(self):
+        """Redraw the dialog once for any pending progress updates"""
+        self._refresh_pending = False
+        self._last_draw = time.monotonic()
+        try:
+            self.dialog.update_idletasks()
+        except tk.TclError:
+            pass
     
     def set_title(self, title: str):
         """Set dialog title"""
         self.title_var.set(title)
     
+    def _stop_draining(self):
+        """Stop polling for posted updates"""
+        try:
+            self.dialog.after_cancel(self._drain_after)
+        except tk.TclError:
+            pass
+    
     def cancel(self):
         """Cancel operation"""
         self.cancelled = True
+        self._stop_draining()
         self.dialog.destroy()
     
     def is_cancelled(self) -> bool:
@@ -854,6 +1029,7 @@ class ProgressDialog:
     
     def close(self):
         """Close dialog"""
+        self._stop_draining()
         try:
             self.dialog.destroy()
         except tk.TclError:
@@ -863,16 +1039,14 @@ def create_modern_dialog(parent, title: str, width: int = 400, height: int = 300
     """Create a modern styled dialog window"""
     dialog = tk.Toplevel(parent)
     dialog.title(title)
-    dialog.geometry(f"{width}x{height}")
     dialog.transient(parent)
     dialog.grab_set()
     dialog.configure(bg=COLORS['bg_primary'])
     
-    # Center dialog
-    dialog.update_idletasks()
+    # Size and center dialog (screen size needs no layout pass)
     x = (dialog.winfo_screenwidth() // 2) - (width // 2)
     y = (dialog.winfo_screenheight() // 2) - (height // 2)
-    dialog.geometry(f"+{x}+{y}")
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
     
     # Create main frame
     main_frame = ttk.Frame(dialog, style='Card.TFrame')
@@ -880,52 +1054,15 @@ def create_modern_dialog(parent, title: str, width: int = 400, height: int = 300
     
     return dialog, main_frame
 
-def show_error_dialog(parent, title: str, message: str):
-    """Show styled error dialog"""
-    dialog, main_frame = create_modern_dialog(parent, title, 450, 200)
-    
-    # Error icon and message
-    ttk.Label(main_frame, text="❌", font=FONTS['large']).pack(pady=10)
-    
-    ttk.Label(main_frame, text=title, style='Heading.TLabel').pack(pady=5)
-    
-    msg_label = ttk.Label(main_frame, text=message, style='Card.TLabel',
-                         wraplength=400, justify='center')
-    msg_label.pack(pady=10, padx=20)
-    
-    # OK button
-    ttk.Button(main_frame, text="OK", command=dialog.destroy,
-              style='Primary.TButton').pack(pady=10)
-    
-    dialog.focus_set()
-
-def show_info_dialog(parent, title: str, message: str):
-    """Show styled info dialog"""
-    dialog, main_frame = create_modern_dialog(parent, title, 450, 200)
-    
-    # Info icon and message
-    ttk.Label(main_frame, text="ℹ️", font=FONTS['large']).pack(pady=10)
-    
-    ttk.Label(main_frame, text=title, style='Heading.TLabel').pack(pady=5)
-    
-    msg_label = ttk.Label(main_frame, text=message, style='Card.TLabel',
-                         wraplength=400, justify='center')
-    msg_label.pack(pady=10, padx=20)
-    
-    # OK button
-    ttk.Button(main_frame, text="OK", command=dialog.destroy,
-              style='Primary.TButton').pack(pady=10)
-    
-    dialog.focus_set()
-
-def show_confirm_dialog(parent, title: str, message: str) -> bool:
-    """Show styled confirmation dialog"""
+def _show_message_dialog(parent, title: str, message: str, icon: str,
+                         buttons: tuple, height: int = 200) -> tuple:
+    """Build a message dialog; buttons are (text, style, result) tuples"""
     result = [False]  # Use list to modify from nested function
     
-    dialog, main_frame = create_modern_dialog(parent, title, 450, 220)
+    dialog, main_frame = create_modern_dialog(parent, title, 450, height)
     
-    # Question icon and message
-    ttk.Label(main_frame, text="❓", font=FONTS['large']).pack(pady=10)
+    # Icon and message
+    ttk.Label(main_frame, text=icon, font=FONTS['large']).pack(pady=10)
     
     ttk.Label(main_frame, text=title, style='Heading.TLabel').pack(pady=5)
     
@@ -935,22 +1072,35 @@ def show_confirm_dialog(parent, title: str, message: str) -> bool:
     
     # Buttons
     btn_frame = ttk.Frame(main_frame)
-    btn_frame.pack(pady=20)
-    
-    def on_yes():
-        result[0] = True
-        dialog.destroy()
+    btn_frame.pack(pady=10 if len(buttons) == 1 else 20)
     
-    def on_no():
-        result[0] = False
+    def close(value):
+        result[0] = value
         dialog.destroy()
     
-    ttk.Button(btn_frame, text="No", command=on_no,
-              style='TButton').pack(side='left', padx=10)
-    ttk.Button(btn_frame, text="Yes", command=on_yes,
-              style='Primary.TButton').pack(side='left', padx=10)
+    for text, style, value in buttons:
+        ttk.Button(btn_frame, text=text, command=lambda v=value: close(v),
+                  style=style).pack(side='left', padx=10)
     
     dialog.focus_set()
+    return dialog, result
+
+def show_error_dialog(parent, title: str, message: str):
+    """Show styled error dialog"""
+    _show_message_dialog(parent, title, message, "❌",
+                         (("OK", 'Primary.TButton', True),))
+
+def show_info_dialog(parent, title: str, message: str):
+    """Show styled info dialog"""
+    _show_message_dialog(parent, title, message, "ℹ️",
+                         (("OK", 'Primary.TButton', True),))
+
+def show_confirm_dialog(parent, title: str, message: str) -> bool:
+    """Show styled confirmation dialog"""
+    dialog, result = _show_message_dialog(parent, title, message, "❓",
+                                          (("No", 'TButton', False),
+                                           ("Yes", 'Primary.TButton', True)),
+                                          height=220)
     dialog.wait_window()
     
-    return result[0]
\ No newline at end of file
+    return result[0]
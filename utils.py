@@ -11,20 +11,34 @@ import hashlib
 import platform
 import subprocess
 import logging
+import math
+from functools import lru_cache, wraps
 from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 import tkinter as tk
 from tkinter import messagebox
 import pyautogui
 import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from config import COLORS, FONTS, EMOJI
 
 logger = logging.getLogger(__name__)
 
 # System Information
-def get_system_info() -> Dict[str, str]:
-    """Get system information for debugging and compatibility"""
+@lru_cache(maxsize=1)
+def _screen_size():
+    """Get screen size once; it is queried from the display server"""
+    return pyautogui.size()
+
+# Operating system name, looked up once
+_SYSTEM = platform.system().lower()
+
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, str]:
+    """Get the parts of the system information that can't change at runtime"""
+    screen = _screen_size()
     return {
         'platform': platform.system(),
         'platform_version': platform.version(),
@@ -32,22 +46,25 @@ def get_system_info() -> Dict[str, str]:
         'architecture': platform.architecture()[0],
         'processor': platform.processor(),
         'python_version': platform.python_version(),
-        'screen_size': f"{pyautogui.size().width}x{pyautogui.size().height}",
-        'python_executable': sys.executable,
-        'current_directory': os.getcwd()
+        'screen_size': f"{screen.width}x{screen.height}",
+        'python_executable': sys.executable
     }
 
+def get_system_info() -> Dict[str, str]:
+    """Get system information for debugging and compatibility"""
+    return {**_static_system_info(), 'current_directory': os.getcwd()}
+
 def is_windows() -> bool:
     """Check if running on Windows"""
-    return platform.system().lower() == 'windows'
+    return _SYSTEM == 'windows'
 
 def is_mac() -> bool:
     """Check if running on macOS"""
-    return platform.system().lower() == 'darwin'
+    return _SYSTEM == 'darwin'
 
 def is_linux() -> bool:
     """Check if running on Linux"""
-    return platform.system().lower() == 'linux'
+    return _SYSTEM == 'linux'
 
 # File Operations
 def ensure_directory(path: Union[str, Path]) -> Path:
@@ -67,25 +84,40 @@ def safe_read_file(filepath: Union[str, Path], default: Any = None) -> Any:
 
 def safe_write_file(filepath: Union[str, Path], data: Any) -> bool:
     """Safely write data to JSON file"""
+    filepath = Path(filepath)
+    tmp_path = filepath.with_suffix(filepath.suffix + '.tmp')
     try:
         # Ensure directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Serialize up front, write in one go, then atomically swap into place
+        content = json.dumps(data, indent=2, ensure_ascii=False)
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
         return True
     except (PermissionError, OSError) as e:
         logger.error(f"Failed to write file {filepath}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
 
 def get_file_hash(filepath: Union[str, Path]) -> str:
-    """Get MD5 hash of file for integrity checking"""
+    """Get BLAKE2b hash of file for integrity checking"""
     try:
-        hash_md5 = hashlib.md5()
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            # file_digest (Python 3.11+) hashes straight from the file buffer
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'blake2b').hexdigest()
+            
+            file_hash = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+            return file_hash.hexdigest()
     except Exception as e:
         logger.error(f"Failed to get hash for {filepath}: {e}")
         return ""
@@ -94,16 +126,16 @@ def backup_file(filepath: Union[str, Path]) -> bool:
     """Create backup of file with timestamp"""
     try:
         filepath = Path(filepath)
-        if not filepath.exists():
-            return False
-        
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_path = filepath.with_suffix(f'.backup_{timestamp}{filepath.suffix}')
         
+        # copy2 opens the source itself, so a missing file needs no separate check
         import shutil
         shutil.copy2(filepath, backup_path)
         logger.info(f"Created backup: {backup_path}")
         return True
+    except FileNotFoundError:
+        return False
     except Exception as e:
         logger.error(f"Failed to backup file {filepath}: {e}")
         return False
@@ -112,7 +144,7 @@ def backup_file(filepath: Union[str, Path]) -> bool:
 def validate_coordinates(x: int, y: int) -> Tuple[bool, str]:
     """Validate screen coordinates"""
     try:
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = _screen_size()
         
         if not isinstance(x, int) or not isinstance(y, int):
             return False, "Coordinates must be integers"
@@ -143,40 +175,39 @@ def validate_delay(delay: float) -> Tuple[bool, str]:
     except Exception as e:
         return False, f"Error validating delay: {e}"
 
+# Keys accepted in hotkey combinations (named keys plus letters and digits)
+_VALID_HOTKEYS = frozenset({
+    'ctrl', 'control', 'alt', 'shift', 'win', 'windows', 'cmd', 'command',
+    'tab', 'enter', 'escape', 'space', 'backspace', 'delete', 'home', 'end',
+    'pageup', 'pagedown', 'up', 'down', 'left', 'right', 'insert',
+    'f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9', 'f10', 'f11', 'f12',
+    *'abcdefghijklmnopqrstuvwxyz', *'0123456789'
+})
+
 def validate_hotkey_keys(keys: List[str]) -> Tuple[bool, str]:
     """Validate hotkey key combination"""
     try:
         if not isinstance(keys, list) or not keys:
             return False, "Keys must be a non-empty list"
         
-        valid_keys = {
-            'ctrl', 'control', 'alt', 'shift', 'win', 'windows', 'cmd', 'command',
-            'tab', 'enter', 'escape', 'space', 'backspace', 'delete', 'home', 'end',
-            'pageup', 'pagedown', 'up', 'down', 'left', 'right', 'insert',
-            'f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9', 'f10', 'f11', 'f12'
-        }
-        
-        # Add letters and numbers
-        valid_keys.update(set('abcdefghijklmnopqrstuvwxyz'))
-        valid_keys.update(set('0123456789'))
-        
         for key in keys:
             if not isinstance(key, str):
                 return False, f"Key '{key}' must be a string"
             
-            if key.lower() not in valid_keys:
+            if key.lower() not in _VALID_HOTKEYS:
                 return False, f"Invalid key: '{key}'"
         
         return True, "Valid hotkey combination"
     except Exception as e:
         return False, f"Error validating keys: {e}"
 
+# Characters not allowed in filenames on some platforms -> '_'
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for cross-platform compatibility"""
-    # Remove/replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid characters in a single pass
+    filename = filename.translate(_FILENAME_TRANS)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -195,7 +226,7 @@ def sanitize_filename(filename: str) -> str:
 def get_screen_info() -> Dict[str, Any]:
     """Get detailed screen information"""
     try:
-        size = pyautogui.size()
+        size = _screen_size()
         return {
             'width': size.width,
             'height': size.height,
@@ -266,25 +297,56 @@ def get_memory_usage() -> Dict[str, float]:
         logger.warning("psutil not available for memory monitoring")
         return {'rss_mb': 0, 'vms_mb': 0, 'percent': 0}
 
+# Latest system resource readings, refreshed by a background sampler
+_RESOURCE_SAMPLE_INTERVAL = 2.0
+_resource_snapshot: Dict[str, Any] = {}
+_resource_sampler = None
+_resource_lock = threading.Lock()
+
+def _sample_resources(psutil) -> Dict[str, Any]:
+    """Take one non-blocking reading of system resources"""
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    
+    return {
+        'cpu_percent': psutil.cpu_percent(interval=None),  # Since last reading
+        'memory_percent': memory.percent,
+        'memory_available_gb': memory.available / 1024 / 1024 / 1024,
+        'disk_percent': disk.percent,
+        'disk_free_gb': disk.free / 1024 / 1024 / 1024
+    }
+
+def _resource_sampler_loop(psutil):
+    """Refresh the resource snapshot periodically"""
+    global _resource_snapshot
+    while True:
+        time.sleep(_RESOURCE_SAMPLE_INTERVAL)
+        try:
+            _resource_snapshot = _sample_resources(psutil)
+        except Exception as e:
+            logger.error(f"Resource sampling failed: {e}")
+
 def monitor_system_resources() -> Dict[str, Any]:
-    """Monitor system resources"""
+    """Monitor system resources (returns the latest background sample)"""
+    global _resource_snapshot, _resource_sampler
     try:
         import psutil
-        
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        return {
-            'cpu_percent': cpu_percent,
-            'memory_percent': memory.percent,
-            'memory_available_gb': memory.available / 1024 / 1024 / 1024,
-            'disk_percent': disk.percent,
-            'disk_free_gb': disk.free / 1024 / 1024 / 1024
-        }
     except ImportError:
         logger.warning("psutil not available for system monitoring")
         return {}
+    
+    with _resource_lock:
+        if _resource_sampler is None:
+            # CPU usage is 0.0 until the sampler has taken its first reading
+            psutil.cpu_percent(interval=None)
+            _resource_snapshot = _sample_resources(psutil)
+            _resource_sampler = threading.Thread(target=_resource_sampler_loop,
+                                                 args=(psutil,),
+                                                 name='playbian-resources',
+                                                 daemon=True)
+            _resource_sampler.start()
+    
+    return dict(_resource_snapshot)
 
 # Threading Utilities
 class SafeThread(threading.Thread):
@@ -312,6 +374,14 @@ class SafeThread(threading.Thread):
             raise self.exception
         return self.result
 
+# Shared worker pool for background tasks; threads are started on demand
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='playbian')
+
+def _log_task_failure(future: Future):
+    """Log exceptions raised by pooled background tasks"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Background task failed: {future.exception()}")
+
 def run_in_thread(func, *args, **kwargs):
     """Run function in a separate thread"""
     thread = SafeThread(target=func, args=args, kwargs=kwargs)
@@ -319,11 +389,18 @@ def run_in_thread(func, *args, **kwargs):
     thread.start()
     return thread
 
+def submit_task(func, *args, **kwargs) -> Future:
+    """Run function on the shared worker pool and return its Future
+    
+    Pool threads are not daemons: interpreter exit waits for running tasks.
+    """
+    future = _EXECUTOR.submit(func, *args, **kwargs)
+    future.add_done_callback(_log_task_failure)
+    return future
+
 # UI Utilities
 def center_window(window, width: int, height: int):
     """Center a tkinter window on screen"""
-    window.update_idletasks()
-    
     # Get screen dimensions
     screen_width = window.winfo_screenwidth()
     screen_height = window.winfo_screenheight()
@@ -338,89 +415,93 @@ def create_gradient_frame(parent, color1: str, color2: str, width: int, height:
     """Create a frame with gradient background (using Canvas)"""
     canvas = tk.Canvas(parent, width=width, height=height, highlightthickness=0)
     
-    # Create gradient effect by drawing multiple rectangles
-    steps = 50
-    for i in range(steps):
-        # Interpolate between colors
-        ratio = i / steps
-        r1, g1, b1 = parent.winfo_rgb(color1)
-        r2, g2, b2 = parent.winfo_rgb(color2)
-        
+    # Build a 1px-wide column, one pixel per row, and stretch it to full width
+    r1, g1, b1 = parent.winfo_rgb(color1)
+    r2, g2, b2 = parent.winfo_rgb(color2)
+    
+    rows = []
+    for y in range(height):
+        ratio = y / height
         r = int(r1 + (r2 - r1) * ratio) // 256
         g = int(g1 + (g2 - g1) * ratio) // 256
         b = int(b1 + (b2 - b1) * ratio) // 256
         
-        color = f"#{r:02x}{g:02x}{b:02x}"
-        
-        y1 = int(height * i / steps)
-        y2 = int(height * (i + 1) / steps)
-        
-        canvas.create_rectangle(0, y1, width, y2, fill=color, outline=color)
+        rows.append(f"{{#{r:02x}{g:02x}{b:02x}}}")
+    
+    column = tk.PhotoImage(master=canvas, width=1, height=height)
+    if rows:
+        column.put(" ".join(rows))
+    image = column.zoom(max(width, 1), 1)
+    canvas.create_image(0, 0, image=image, anchor='nw')
+    canvas.image = image  # Keep a reference so the image isn't collected
     
     return canvas
 
 def show_notification(title: str, message: str, duration: int = 3000):
     """Show a temporary notification window"""
     notification = tk.Toplevel()
+    notification.withdraw()  # Shown once positioned
     notification.title(title)
     notification.configure(bg=COLORS['bg_secondary'])
     notification.overrideredirect(True)  # Remove window decorations
     
-    # Create content
-    frame = tk.Frame(notification, bg=COLORS['bg_secondary'], padx=20, pady=10)
-    frame.pack()
-    
-    title_label = tk.Label(frame, text=title, font=FONTS['heading'],
+    # Create content directly in the window
+    title_label = tk.Label(notification, text=title, font=FONTS['heading'],
                           bg=COLORS['bg_secondary'], fg=COLORS['text_primary'])
-    title_label.pack()
+    title_label.pack(padx=20, pady=(10, 0))
     
-    msg_label = tk.Label(frame, text=message, font=FONTS['default'],
+    msg_label = tk.Label(notification, text=message, font=FONTS['default'],
                         bg=COLORS['bg_secondary'], fg=COLORS['text_secondary'],
                         wraplength=300)
-    msg_label.pack(pady=(5, 0))
-    
-    # Position notification
-    notification.update_idletasks()
-    width = notification.winfo_reqwidth()
-    height = notification.winfo_reqheight()
-    
-    screen_width = notification.winfo_screenwidth()
-    screen_height = notification.winfo_screenheight()
+    msg_label.pack(padx=20, pady=(5, 10))
     
-    x = screen_width - width - 20
-    y = screen_height - height - 50
+    def place():
+        """Position notification once Tk has computed its size"""
+        x = notification.winfo_screenwidth() - notification.winfo_reqwidth() - 20
+        y = notification.winfo_screenheight() - notification.winfo_reqheight() - 50
+        notification.geometry(f"+{x}+{y}")
+        notification.deiconify()
     
-    notification.geometry(f"+{x}+{y}")
+    # Position notification on the next idle pass instead of forcing layout now
+    notification.after_idle(place)
     
     # Auto-close after duration
     notification.after(duration, notification.destroy)
     
     return notification
 
-def copy_to_clipboard(text: str) -> bool:
+# Hidden root used for clipboard access when no Tk root exists yet
+_clip_root = None
+
+def _get_clip_root(parent=None):
+    """Get a Tk widget for clipboard access, reusing the app root if there is one"""
+    global _clip_root
+    if parent is not None:
+        return parent
+    if tk._default_root is not None:
+        return tk._default_root
+    if _clip_root is None or not _clip_root.winfo_exists():
+        _clip_root = tk.Tk()
+        _clip_root.withdraw()  # Hide the window
+    return _clip_root
+
+def copy_to_clipboard(text: str, parent=None) -> bool:
     """Copy text to system clipboard"""
     try:
-        import tkinter as tk
-        root = tk.Tk()
-        root.withdraw()  # Hide the window
+        root = _get_clip_root(parent)
         root.clipboard_clear()
         root.clipboard_append(text)
-        root.update()  # Required to make the clipboard copy work
-        root.destroy()
+        if root is _clip_root:
+            root.update()  # No mainloop runs for the hidden root
         return True
     except Exception as e:
         logger.error(f"Failed to copy to clipboard: {e}")
         return False
 
-def get_clipboard_text() -> str:
+def get_clipboard_text(parent=None) -> str:
     """Get text from system clipboard"""
     try:
-        import tkinter as tk
-        root = tk.Tk()
-        root.withdraw()
-        text = root.clipboard_get()
-        root.destroy()
-        return text
+        return _get_clip_root(parent).clipboard_get()
     except Exception as e:
         logger.error(f"Failed to get clipboard text: {e}")
         return ""
@@ -440,13 +521,13 @@ def format_duration(seconds: float) -> str:
         secs = seconds % 60
         return f"{hours}h {minutes}m {secs:.1f}s"
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_file_size(bytes_size: int) -> str:
     """Format file size in bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} PB"
+    # Each unit is 2**10 times the previous one
+    i = min(len(_SIZE_UNITS) - 1, int(math.log2(max(bytes_size, 1))) // 10)
+    return f"{bytes_size / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
     """Truncate text to specified length with suffix"""
@@ -454,9 +535,12 @@ def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
         return text
     return text[:max_length - len(suffix)] + suffix
 
+# HTML special characters -> entities
+_HTML_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
 def escape_special_chars(text: str) -> str:
     """Escape special characters for safe display"""
-    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return text.translate(_HTML_TRANS)
 
 # Error Handling and Logging Utilities
 def setup_error_logging(log_file: str = None):
@@ -522,31 +606,73 @@ def debug_print(message: str, level: str = "DEBUG"):
     timestamp = time.strftime("%H:%M:%S")
     print(f"[{timestamp}] [{level}] {message}")
 
+# One profiler per thread for @profile_function calls; stats are merged and logged at exit
+_profile_local = threading.local()
+_profilers = []
+_profilers_lock = threading.Lock()
+
+def _thread_profiler():
+    """Get this thread's profiler, creating and registering it on first use"""
+    profiler = getattr(_profile_local, 'profiler', None)
+    if profiler is None:
+        import cProfile
+        profiler = cProfile.Profile()
+        _profile_local.profiler = profiler
+        _profile_local.depth = 0
+        with _profilers_lock:
+            if not _profilers:
+                import atexit
+                atexit.register(_dump_profile_stats)
+            _profilers.append(profiler)
+    return profiler
+
+def _dump_profile_stats():
+    """Log aggregated stats for all profiled calls"""
+    import pstats
+    import io
+    
+    with _profilers_lock:
+        profilers = list(_profilers)
+    
+    # pstats rejects profilers that never recorded anything
+    for profiler in profilers:
+        profiler.create_stats()
+    profilers = [profiler for profiler in profilers if profiler.stats]
+    if not profilers:
+        return
+    
+    s = io.StringIO()
+    ps = pstats.Stats(*profilers, stream=s)
+    ps.sort_stats('cumulative')
+    ps.print_stats(10)  # Top 10 functions
+    
+    logger.debug(f"Profile for decorated functions:\n{s.getvalue()}")
+
 def profile_function(func):
     """Decorator to profile function performance"""
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        import cProfile
-        import pstats
-        import io
-        
-        profiler = cProfile.Profile()
-        profiler.enable()
-        
-        result = func(*args, **kwargs)
-        
-        profiler.disable()
-        
-        # Print stats
-        s = io.StringIO()
-        ps = pstats.Stats(profiler, stream=s)
-        ps.sort_stats('cumulative')
-        ps.print_stats(10)  # Top 10 functions
-        
-        logger.debug(f"Profile for {func.__name__}:\n{s.getvalue()}")
-        
-        return result
+        profiler = _thread_profiler()
+        local = _profile_local
+        
+        # Only the thread's outermost profiled call toggles its profiler
+        local.depth += 1
+        if local.depth == 1:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another thread is already profiling (Python 3.12+)
+                logger.debug(f"Profiling skipped for {func.__qualname__} in "
+                             f"{threading.current_thread().name}: another profiler is active")
+        try:
+            return func(*args, **kwargs)
+        finally:
+            local.depth -= 1
+            if local.depth == 0:
+                profiler.disable()
     return wrapper
 
+@lru_cache(maxsize=1)
 def check_dependencies() -> Dict[str, bool]:
     """Check if all required dependencies are available"""
     dependencies = {
@@ -602,9 +728,9 @@ def generate_error_report() -> str:
         log_file = LOGGING_CONFIG['file']
         if os.path.exists(log_file):
             report.append("Recent Log Entries (last 20 lines):")
+            # Keep only the tail while streaming through the file
             with open(log_file, 'r') as f:
-                lines = f.readlines()
-                for line in lines[-20:]:
+                for line in deque(f, maxlen=20):
                     report.append(f"  {line.strip()}")
     except:
         report.append("Could not read log file")
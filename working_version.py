@@ -5,34 +5,202 @@ Simplified to ensure compatibility
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import pyautogui
+from tkinter import ttk
 import time
 import json
 import threading
 import logging
+from collections import deque
+import ctypes
+from ctypes import wintypes
+
+try:
+    import orjson  # Optional, much faster for large sequences
+except ImportError:
+    orjson = None
+
+# Imported on first use; pyautogui pulls in PIL and several helper packages
+pyautogui = None
+_typewrite = _click = None  # pyautogui functions, bound by _pg()
+
+# Bound once so the action executors skip the module attribute lookup
+_sleep = time.sleep
+_perf_counter = time.perf_counter
+
+def _pg():
+    """Import and configure pyautogui on first use"""
+    global pyautogui, _typewrite, _click
+    if pyautogui is None:
+        import pyautogui as _pyautogui
+        # SimpleAction handles its own delays; drop pyautogui's implicit pause after every call
+        _pyautogui.PAUSE = 0
+        _pyautogui.MINIMUM_DURATION = 0
+        _pyautogui.MINIMUM_SLEEP = 0
+        pyautogui = _pyautogui
+        _typewrite = _pyautogui.typewrite
+        _click = _pyautogui.click
+    return pyautogui
 
 # Simple logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Native keyboard input (Windows only); other platforms fall back to pyautogui
+try:
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _winmm = ctypes.WinDLL('winmm')
+except (AttributeError, OSError):
+    _user32 = _winmm = None
+
+# pyautogui used to do this on import; coordinates must stay in physical pixels
+if _user32 is not None:
+    try:
+        _user32.SetProcessDPIAware()
+    except AttributeError:
+        pass  # Older than Windows Vista
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_TAB = 0x09
+VK_RETURN = 0x0D
+
+# Mouse button -> (down, up) mouse_event flags
+_BTN_FLAGS = {'left': (0x0002, 0x0004), 'right': (0x0008, 0x0010), 'middle': (0x0020, 0x0040)}
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [('wVk', wintypes.WORD), ('wScan', wintypes.WORD),
+                ('dwFlags', wintypes.DWORD), ('time', wintypes.DWORD),
+                ('dwExtraInfo', wintypes.WPARAM)]
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [('dx', wintypes.LONG), ('dy', wintypes.LONG),
+                ('mouseData', wintypes.DWORD), ('dwFlags', wintypes.DWORD),
+                ('time', wintypes.DWORD), ('dwExtraInfo', wintypes.WPARAM)]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [('ki', KEYBDINPUT), ('mi', MOUSEINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [('type', wintypes.DWORD), ('u', _INPUTUNION)]
+
+# Per-thread reusable INPUT array for SendInput
+_INPUT_SCRATCH = threading.local()
+
+def _get_scratch(n):
+    """Get this thread's INPUT buffer, grown to hold at least n events"""
+    buf = getattr(_INPUT_SCRATCH, 'buf', None)
+    if buf is None or len(buf) < n:
+        buf = (INPUT * max(n, 256))()
+        _INPUT_SCRATCH.buf = buf
+    return buf
+
+# Control characters sent as virtual keys rather than unicode text
+_VK_CHARS = {'\n': VK_RETURN, '\r': VK_RETURN, '\t': VK_TAB}
+
+def _send_unicode_batch(text):
+    """Type text with a single SendInput call; False if unavailable"""
+    if _user32 is None:
+        return False
+    
+    # One (vk, scan, flags) per key event, down and up for each UTF-16 unit
+    events = []
+    for ch in text:
+        vk = _VK_CHARS.get(ch)
+        if vk:
+            events.append((vk, 0, 0))
+            events.append((vk, 0, KEYEVENTF_KEYUP))
+            continue
+        units = ch.encode('utf-16-le')
+        for i in range(0, len(units), 2):
+            scan = units[i] | (units[i + 1] << 8)
+            events.append((0, scan, KEYEVENTF_UNICODE))
+            events.append((0, scan, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    
+    inputs = _get_scratch(len(events))
+    for inp, (vk, scan, flags) in zip(inputs, events):
+        inp.type = INPUT_KEYBOARD
+        inp.u.ki.wVk = vk
+        inp.u.ki.wScan = scan
+        inp.u.ki.dwFlags = flags
+    
+    sent = _user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+    if sent != len(events):
+        logger.warning(f"SendInput delivered {sent}/{len(events)} key events")
+    return True
+
+def _precise_sleep(seconds):
+    """Sleep accurately: coarse sleep, then spin for the last 2ms"""
+    if seconds <= 0:
+        return
+    perf_counter = _perf_counter
+    end = perf_counter() + seconds
+    coarse = seconds - 0.002
+    if coarse > 0:
+        _sleep(coarse)
+    while perf_counter() < end:
+        pass
+
+def _failsafe_check():
+    """Honour pyautogui's corner failsafe before native input, which bypasses it"""
+    (pyautogui or _pg()).failSafeCheck()
+
+def _do_type(action):
+    _precise_sleep(action.delay)
+    if _user32 is not None:
+        _failsafe_check()
+    if not _send_unicode_batch(action.data):
+        if _typewrite is None:
+            _pg()
+        _typewrite(action.data)
+
+def _do_click(action):
+    _precise_sleep(action.delay)
+    if action._flags:
+        down, up = action._flags
+        _failsafe_check()
+        _user32.SetCursorPos(action._x, action._y)
+        _user32.mouse_event(down, 0, 0, 0, 0)
+        _user32.mouse_event(up, 0, 0, 0, 0)
+    else:
+        if _click is None:
+            _pg()
+        _click(action._x, action._y, button=action._button)
+
+def _do_delay(action):
+    # Delay actions wait once for their own delay plus the wait time
+    _precise_sleep(action.delay + action.data)
+
+def _do_nothing(action):
+    pass
+
+# Action type -> executor, resolved once per action
+_EXECUTORS = {'type': _do_type, 'click': _do_click, 'delay': _do_delay}
+
 class SimpleAction:
+    # No per-instance __dict__; click-only fields are left unset for other types
+    __slots__ = ('action_type', 'data', 'delay', '_str', '_execute',
+                 '_x', '_y', '_button', '_flags')
+    
     def __init__(self, action_type, data, delay=0):
         self.action_type = action_type
         self.data = data
         self.delay = delay
+        self._str = None  # Display text, built on first use
+        self._execute = _EXECUTORS.get(action_type, _do_nothing)
+        if action_type == 'click':
+            self._x, self._y, self._button = data
+            self._flags = _BTN_FLAGS.get(self._button) if _user32 else None
     
     def execute(self):
-        time.sleep(self.delay)
-        if self.action_type == 'type':
-            pyautogui.typewrite(self.data)
-        elif self.action_type == 'click':
-            x, y, button = self.data
-            pyautogui.click(x, y, button=button)
-        elif self.action_type == 'delay':
-            time.sleep(self.data)
+        self._execute(self)
     
     def __str__(self):
+        if self._str is None:
+            self._str = self._format()
+        return self._str
+    
+    def _format(self):
         if self.action_type == 'type':
             return f"Type: '{self.data}' (delay: {self.delay}s)"
         elif self.action_type == 'click':
@@ -42,6 +210,9 @@ class SimpleAction:
             return f"Wait {self.data} seconds"
 
 class WorkingAutoTyper:
+    # Rows are only built for actions that have been scrolled into reach
+    ROW_CHUNK = 100
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Playbian Auto Typer (Working Version)")
@@ -49,12 +220,26 @@ class WorkingAutoTyper:
         self.root.configure(bg='#1a1a1a')
         
         self.actions = []
-        self.position_tracking = False
+        self._rows_shown = 0  # Actions currently materialized in the listbox
+        # Mutable cells shared with the position tracking closure
+        self._track_flag = [False]  # Whether tracking fills x_var/y_var
+        self._last_xy = [None]  # Coordinates last written to x_var/y_var
         self.running = False
+        self._countdown_after = None  # Pending countdown step, if any
+        
+        # Status messages posted by the automation thread; only the latest is shown
+        self._status_q = deque(maxlen=1)
+        
+        # One long-lived automation thread, woken for each run
+        self._run_event = threading.Event()
+        self._run_gen = 0  # Bumped on every start so a stopped run can't carry on into the next
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
         
         self.setup_style()
         self.setup_ui()
         self.start_position_tracking()
+        self.root.bind('<<StatusUpdate>>', self._on_status)
     
     def setup_style(self):
         """Setup dark theme styling"""
@@ -151,12 +336,13 @@ class WorkingAutoTyper:
         list_container.pack(fill='both', expand=True, padx=10, pady=5)
         
         self.actions_listbox = tk.Listbox(list_container, bg='#404040', fg='white',
-                                         selectbackground='#4d79ff', font=('Consolas', 9))
-        scrollbar = ttk.Scrollbar(list_container, orient='vertical', command=self.actions_listbox.yview)
-        self.actions_listbox.configure(yscrollcommand=scrollbar.set)
+                                         selectbackground='#4d79ff', font=('Consolas', 9),
+                                         selectmode='extended')
+        self.list_scrollbar = ttk.Scrollbar(list_container, orient='vertical', command=self.actions_listbox.yview)
+        self.actions_listbox.configure(yscrollcommand=self._on_list_scroll)
         
         self.actions_listbox.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
+        self.list_scrollbar.pack(side='right', fill='y')
         
         # List controls
         list_controls = ttk.Frame(list_frame)
@@ -204,13 +390,39 @@ class WorkingAutoTyper:
         # Focus on text entry
         text_entry.focus_set()
     
+    def _on_list_scroll(self, first, last):
+        """Update the scrollbar and add rows once the end of the list is visible"""
+        self.list_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self._rows_shown < len(self.actions):
+            self.root.after_idle(self._show_more_rows)
+    
+    def _show_more_rows(self):
+        """Materialize the next chunk of action rows"""
+        end = min(len(self.actions), self._rows_shown + self.ROW_CHUNK)
+        if end > self._rows_shown:
+            rows = [str(action) for action in self.actions[self._rows_shown:end]]
+            self.actions_listbox.insert('end', *rows)
+            self._rows_shown = end
+    
+    def _refresh_rows(self):
+        """Rebuild the listbox, showing only the first chunk of actions"""
+        self.actions_listbox.delete(0, 'end')
+        self._rows_shown = 0
+        self._show_more_rows()
+    
+    def _append_row(self, action):
+        """Show a newly added action if all earlier ones are already shown"""
+        if self._rows_shown == len(self.actions) - 1:
+            self.actions_listbox.insert('end', str(action))
+            self._rows_shown += 1
+    
     def add_type_action(self):
         text = self.text_var.get().strip()
         if text:
             delay = self.type_delay_var.get()
             action = SimpleAction('type', text, delay)
             self.actions.append(action)
-            self.actions_listbox.insert('end', str(action))
+            self._append_row(action)
             self.text_var.set("")
             self.status_var.set(f"Added typing action. Total: {len(self.actions)}")
             logger.info(f"Added type action: {text}")
@@ -223,7 +435,7 @@ class WorkingAutoTyper:
         delay = self.click_delay_var.get()
         action = SimpleAction('click', (x, y, button), delay)
         self.actions.append(action)
-        self.actions_listbox.insert('end', str(action))
+        self._append_row(action)
         self.status_var.set(f"Added click action. Total: {len(self.actions)}")
         logger.info(f"Added click action: {button} at ({x}, {y})")
     
@@ -231,21 +443,24 @@ class WorkingAutoTyper:
         wait_time = self.wait_var.get()
         action = SimpleAction('delay', wait_time)
         self.actions.append(action)
-        self.actions_listbox.insert('end', str(action))
+        self._append_row(action)
         self.status_var.set(f"Added delay action. Total: {len(self.actions)}")
         logger.info(f"Added delay action: {wait_time}s")
     
     def delete_selected(self):
         selection = self.actions_listbox.curselection()
         if selection:
-            index = selection[0]
-            self.actions.pop(index)
-            self.actions_listbox.delete(index)
-            self.status_var.set(f"Deleted action. Total: {len(self.actions)}")
+            # Delete back to front so earlier indices stay valid
+            for index in sorted(selection, reverse=True):
+                del self.actions[index]
+                self.actions_listbox.delete(index)
+            self._rows_shown -= len(selection)
+            self.status_var.set(f"Deleted {len(selection)} action(s). Total: {len(self.actions)}")
     
     def toggle_tracking(self):
-        self.position_tracking = not self.position_tracking
-        if self.position_tracking:
+        self._track_flag[0] = not self._track_flag[0]
+        self._last_xy[0] = None  # Fields may have been edited by hand meanwhile
+        if self._track_flag[0]:
             self.track_btn.config(text="⏹️ Stop Tracking")
             self.status_var.set("Mouse tracking enabled - Move mouse to update coordinates")
             logger.info("Mouse tracking enabled")
@@ -255,61 +470,127 @@ class WorkingAutoTyper:
             logger.info("Mouse tracking disabled")
     
     def start_position_tracking(self):
+        # Everything the tick touches is captured once as a local
+        root = self.root
+        pos_v, x_v, y_v = self.position_var, self.x_var, self.y_var
+        track_flag, last_xy = self._track_flag, self._last_xy
+        # Tk queries the pointer natively, without pyautogui's wrapper
+        get_pos = root.winfo_pointerxy
+        
+        last_pos = None
+        moved_at = time.monotonic()
+        
         def update():
+            nonlocal last_pos, moved_at
+            interval = 100
             try:
-                x, y = pyautogui.position()
-                self.position_var.set(f"Mouse: ({x}, {y})")
+                pos = get_pos()
+                if pos != last_pos:
+                    last_pos = pos
+                    moved_at = time.monotonic()
+                    pos_v.set(f"Mouse: ({pos[0]}, {pos[1]})")
+                elif time.monotonic() - moved_at > 2:
+                    interval = 250  # Poll less often while the mouse is idle
                 
-                if self.position_tracking:
-                    self.x_var.set(x)
-                    self.y_var.set(y)
+                if track_flag[0] and pos != last_xy[0]:
+                    x_v.set(pos[0])
+                    y_v.set(pos[1])
+                    last_xy[0] = pos
             except Exception as e:
                 logger.error(f"Position tracking error: {e}")
             
-            self.root.after(100, update)
+            root.after(interval, update)
         update()
     
+    def _post_status(self, message):
+        """Hand a status message from the automation thread to the UI"""
+        self._status_q.append(message)
+        try:
+            self.root.event_generate('<<StatusUpdate>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass  # Window is closing
+    
+    def _on_status(self, event=None):
+        """Show the most recent posted status; earlier ones were replaced"""
+        try:
+            message = self._status_q.pop()
+        except IndexError:
+            return  # Already shown by an earlier event
+        self.status_var.set(message)
+    
     def start_automation(self):
         if self.running or not self.actions:
             if not self.actions:
                 self.status_var.set("No actions to run! Add some actions first.")
             return
         
+        # Import pyautogui now rather than in the middle of the first action
+        try:
+            _pg()
+        except ImportError as e:
+            self.status_var.set(f"❌ Error: {e}")
+            logger.error(f"pyautogui unavailable: {e}")
+            return
+        
         self.running = True
+        self._run_gen += 1
+        self._countdown(3, self._run_event.set)
+    
+    def _countdown(self, n, on_done):
+        """Count down on the UI thread, then call on_done"""
+        self._countdown_after = None
+        if not self.running:
+            return
+        if n == 0:
+            on_done()
+            return
         
-        def run():
-            try:
-                # Countdown
-                for i in range(3, 0, -1):
-                    if not self.running:
-                        return
-                    self.root.after(0, lambda i=i: self.status_var.set(f"Starting in {i} seconds..."))
-                    time.sleep(1)
-                
-                # Execute actions
-                for i, action in enumerate(self.actions):
-                    if not self.running:
-                        break
-                    
-                    self.root.after(0, lambda i=i: self.status_var.set(f"Running action {i+1}/{len(self.actions)}: {str(action)[:50]}..."))
-                    action.execute()
+        self.status_var.set(f"Starting in {n} seconds...")
+        self._countdown_after = self.root.after(1000, self._countdown, n - 1, on_done)
+    
+    def _worker_loop(self):
+        """Run the action sequence each time a start is requested"""
+        while True:
+            self._run_event.wait()
+            self._run_event.clear()
+            self._execute_sequence(self._run_gen)
+    
+    def _execute_sequence(self, gen):
+        """Run every action in order, unless run generation gen is superseded"""
+        # Raise the Windows timer resolution to 1ms while automation runs
+        if _winmm:
+            _winmm.timeBeginPeriod(1)
+        try:
+            # Execute actions
+            for i, action in enumerate(self.actions):
+                if not self.running or self._run_gen != gen:
+                    break
                 
+                self._post_status(f"Running action {i+1}/{len(self.actions)}: {str(action)[:50]}...")
+                action.execute()
+            
+            # A superseded run leaves the status line to the newer one
+            if self._run_gen == gen:
                 if self.running:
-                    self.root.after(0, lambda: self.status_var.set("✅ Automation completed successfully!"))
+                    self._post_status("✅ Automation completed successfully!")
                 else:
-                    self.root.after(0, lambda: self.status_var.set("⏹️ Automation stopped by user"))
-                    
-            except Exception as e:
-                self.root.after(0, lambda: self.status_var.set(f"❌ Error: {e}"))
-                logger.error(f"Automation error: {e}")
-            finally:
+                    self._post_status("⏹️ Automation stopped by user")
+                
+        except Exception as e:
+            self._post_status(f"❌ Error: {e}")
+            logger.error(f"Automation error: {e}")
+        finally:
+            if self._run_gen == gen:
                 self.running = False
-        
-        threading.Thread(target=run, daemon=True).start()
+            if _winmm:
+                _winmm.timeEndPeriod(1)
     
     def stop_automation(self):
         if self.running:
             self.running = False
+            if self._countdown_after:
+                self.root.after_cancel(self._countdown_after)
+                self._countdown_after = None
             self.status_var.set("Stopping automation...")
             logger.info("Automation stopped by user")
         else:
@@ -317,16 +598,19 @@ class WorkingAutoTyper:
     
     def clear_actions(self):
         if self.actions:
+            from tkinter import messagebox
             if messagebox.askyesno("Confirm", "Clear all actions?"):
-                self.actions.clear()
                 self.actions_listbox.delete(0, 'end')
+                self.actions = []
+                self._rows_shown = 0
                 self.status_var.set("All actions cleared")
     
     def save_actions(self):
         if not self.actions:
             self.status_var.set("No actions to save")
             return
-            
+        
+        from tkinter import filedialog, messagebox
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -335,16 +619,15 @@ class WorkingAutoTyper:
         
         if filename:
             try:
-                data = []
-                for action in self.actions:
-                    data.append({
-                        'type': action.action_type,
-                        'data': action.data,
-                        'delay': action.delay
-                    })
+                data = [{'type': action.action_type, 'data': action.data, 'delay': action.delay}
+                        for action in self.actions]
                 
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2)
+                if orjson:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
                 
                 self.status_var.set(f"✅ Saved {len(self.actions)} actions to {filename}")
                 logger.info(f"Saved actions to {filename}")
@@ -353,6 +636,7 @@ class WorkingAutoTyper:
                 self.status_var.set("❌ Failed to save actions")
     
     def load_actions(self):
+        from tkinter import filedialog, messagebox
         filename = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             title="Load Action Sequence"
@@ -360,16 +644,19 @@ class WorkingAutoTyper:
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
+                if orjson:
+                    with open(filename, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(filename, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
                 
-                self.actions.clear()
-                self.actions_listbox.delete(0, 'end')
+                self.actions = [SimpleAction(item['type'], item['data'], item.get('delay', 0))
+                                for item in data]
                 
-                for item in data:
-                    action = SimpleAction(item['type'], item['data'], item.get('delay', 0))
-                    self.actions.append(action)
-                    self.actions_listbox.insert('end', str(action))
+                # Rebuild the rows in one insert on the next idle pass; rows for
+                # off-screen actions are built as the list is scrolled
+                self.root.after_idle(self._refresh_rows)
                 
                 self.status_var.set(f"✅ Loaded {len(self.actions)} actions from {filename}")
                 logger.info(f"Loaded actions from {filename}")